@@ -3,11 +3,17 @@
 import os
 import sys
 
+_SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+_ALREADY_ADDED = False
+
 def add_src_to_path():
     """
     Ensure the 'src' directory is included in Python's module search path.
 
-    This function should be called at the start of any script outside 'src/' (e.g. in 'scripts/')
+    Prefer `pip install -e .` (see README): the scripts no longer call this and import
+    `dfm_pipeline` directly. Kept for ad-hoc use without an install; repeated calls are no-ops.
+
+    Without an install, call it at the start of any script outside 'src/' (e.g. in 'scripts/')
     so that packages inside 'src/dfm_pipeline/' can be imported using absolute imports like:
         from dfm_pipeline.utils.data_loader import load_data
 
@@ -15,8 +21,10 @@ def add_src_to_path():
     - Python by default doesn't treat 'src' as part of sys.path
     - This helps scripts in 'scripts/' or other folders run without ModuleNotFoundError
     """
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    src_path = os.path.abspath(os.path.join(current_dir, "..", "src"))
+    global _ALREADY_ADDED
+    if _ALREADY_ADDED:
+        return
 
-    if src_path not in sys.path:
-        sys.path.append(src_path)
+    if _SRC_PATH not in sys.path:
+        sys.path.append(_SRC_PATH)
+    _ALREADY_ADDED = True
@@ -1,12 +1,6 @@
 # scripts/check_series_metadata.py
 
 import logging
-from scripts.bootstrap import add_src_to_path
-
-# Add src/ to the Python path
-add_src_to_path()
-
-from dfm_pipeline.validation.check_frequency_and_seasonality import validate_series_metadata
 
 def setup_logging():
     """Set up logging format for clarity."""
@@ -18,6 +12,9 @@ def setup_logging():
 
 def main():
     setup_logging()
+    # Deferred: pulls in requests/bs4, only needed once we actually validate
+    from dfm_pipeline.validation.check_frequency_and_seasonality import validate_series_metadata
+
     txt_path = "series_labels.txt"  # Adjust this path if needed
 
     logging.info("Starting metadata validation for FRED-MD series...")
@@ -1,13 +1,7 @@
 # scripts/download_data.py
 
 import logging
-from bootstrap import add_src_to_path
-
-# Ensure src/ is in the Python path
-add_src_to_path()
-
-from dfm_pipeline.utils.config_loader import load_config
-from dfm_pipeline.ingestion.downloader import download_csv
+import os
 
 def setup_logging():
     """Configure logging to console."""
@@ -18,6 +12,7 @@ def setup_logging():
 
 def main():
     setup_logging()
+    from dfm_pipeline.utils.config_loader import load_config
     config = load_config()
 
     filename = config["paths"]["raw_filename"]
@@ -27,6 +22,8 @@ def main():
         logging.info(f"Raw file already exists at {raw_path}. Skipping download.")
     else:
         logging.info("Raw file not found. Starting download...")
+        # Deferred: requests is only needed when a download actually happens
+        from dfm_pipeline.ingestion.downloader import download_csv
         try:
             download_csv(overwrite=False)
             logging.info("Download completed successfully.")
@@ -34,5 +31,4 @@ def main():
             logging.error(f"Download failed: {e}")
 
 if __name__ == "__main__":
-    import os  # Needed for raw_path logic
     main()
@@ -1,12 +1,10 @@
-from bootstrap import add_src_to_path
-add_src_to_path()
-
-from dfm_pipeline.utils.data_loader import load_data
-from dfm_pipeline.utils.metadata_tools import extract_series_labels
-
 def main():
-    df, _ = load_data(stage="raw")
-    extract_series_labels(df)
+    from dfm_pipeline.utils.data_loader import data_path, load_headers
+    from dfm_pipeline.utils.metadata_tools import extract_series_labels
+
+    # Only the header is needed for the labels: skip parsing the data rows
+    cols = load_headers(data_path(stage="raw"))
+    extract_series_labels([c for c in cols if c != "sasdate"])  # date column is not a series
 
 if __name__ == "__main__":
     main()
@@ -1,20 +1,6 @@
-import sys
 import os
 import logging
 import argparse
-import pandas as pd
-
-# Add src/ to Python path
-current_dir = os.path.dirname(__file__)
-src_path = os.path.abspath(os.path.join(current_dir, "..", "src"))
-sys.path.append(src_path)
-
-from dfm_pipeline.utils.data_loader import load_data
-from dfm_pipeline.utils.grouping_series import (
-    assign_variable_groups,
-    filter_by_group,
-    create_metadata_df
-)
 
 def setup_logging():
     """Set up console logging format."""
@@ -42,6 +28,14 @@ def main():
     args = parse_args()
     selected_group = args.group
 
+    # Deferred until argparse succeeds (pandas import is the bulk of startup)
+    from dfm_pipeline.utils.data_loader import load_data
+    from dfm_pipeline.utils.grouping_series import (
+        assign_variable_groups,
+        filter_by_group,
+        create_metadata_df
+    )
+
     # Load raw dataset
     df, _ = load_data(stage="raw")
     logging.info(f"✅ Data loaded successfully: shape = {df.shape}")
@@ -50,7 +44,8 @@ def main():
     group_series = assign_variable_groups(df)
 
     print_section_header("Variable Group Distribution")
-    print(group_series.value_counts().to_string())
+    counts = group_series.value_counts()
+    print(counts[counts > 0].to_string())  # categorical counts include empty groups
 
     # Create and save metadata DataFrame
     metadata = create_metadata_df(df)
@@ -1,39 +1,55 @@
 # scripts/ingestion/build_transformed_panel.py
 from pathlib import Path
 import os
-import json
-import pandas as pd
-
-from dfm_pipeline.ingestion.fred_md import detect_tcode_row
-from dfm_pipeline.preprocessing.tcode import apply_tcode_transformations
 
 
 def main() -> None:
+    import numpy as np
+    import pandas as pd
+
+    from dfm_pipeline.ingestion.fred_md import detect_tcode_row
+    from dfm_pipeline.preprocessing.tcode import ALLOWED_TCODES, apply_tcode_transformations_into
+    from dfm_pipeline.validation.tcode_map import allowed_tcode_mask
+    from dfm_pipeline.utils.cached_config import load_json
+    from dfm_pipeline.utils.io import read_csv_fast, save_panel_csv
+
     # ---- Inputs ----
     csv_path = Path("data/raw_data/fred_md_current.csv")
     json_path = Path("data/metadata/tcode_map.json")
 
     # ---- Read raw CSV, skip embedded t-code row, keep dates as-is ----
     tcode_row = detect_tcode_row(csv_path, date_col="sasdate") or 1
-    df = pd.read_csv(
-        csv_path,
-        skiprows=[tcode_row],          # skip the row with t-codes
-        parse_dates=["sasdate"],
-        index_col="sasdate",
-    ).sort_index()
-    df.index.name = "sasdate"
-
-    # ---- Load t-code map ----
-    with open(json_path, "r", encoding="utf-8") as f:
-        tcode_map = {k: int(v) for k, v in json.load(f).items()}
+    df = read_csv_fast(csv_path, skiprows=[tcode_row])  # skip the row with t-codes
+    df["sasdate"] = pd.to_datetime(df["sasdate"], format="%m/%d/%Y")
+    df = df.set_index("sasdate")
+    # FRED-MD ships in date order; only sort (and flag it) when it doesn't. Blank rows
+    # (e.g. a trailing ",,,") parse to NaT and are ignored by the order check.
+    if not df.index.dropna().is_monotonic_increasing:
+        print(f"[WARN] {csv_path} dates are not in increasing order; sorting.")
+        df = df.sort_index()
+
+    # ---- Load t-code map (memoized on path + mtime) ----
+    tcode_map = {k: int(v) for k, v in load_json(json_path).items()}
 
     # Sanity check: every column needs a t-code
-    missing = [c for c in df.columns if c not in tcode_map]
+    missing = set(df.columns).difference(tcode_map)
     if missing:
-        raise KeyError(f"No tcode provided for columns: {missing}")
+        raise KeyError(f"No tcode provided for columns: {sorted(missing)}")
+
+    # One code per column, checked in one vectorized bitmask test
+    codes = np.fromiter((tcode_map[c] for c in df.columns), dtype=np.int64, count=df.shape[1])
+    bad = np.flatnonzero(~allowed_tcode_mask(codes))
+    if bad.size:
+        invalid = {df.columns[i]: tcode_map[df.columns[i]] for i in bad}
+        raise ValueError(f"Invalid tcodes detected: {invalid}. Allowed: {sorted(ALLOWED_TCODES)}")
 
     # ---- Transform (unbalanced/ragged panel) ----
-    X = apply_tcode_transformations(df, tcode_map)
+    # Stream each column straight into one preallocated array: no intermediate DataFrame
+    arr = df.to_numpy(dtype=np.float64, copy=False)
+    out = np.empty_like(arr)
+    apply_tcode_transformations_into(arr, codes.astype(np.int8), out)
+    X = pd.DataFrame(out, index=df.index, columns=df.columns, copy=False)
+    del df, arr
 
     # ---- Outputs (env-configurable) ----
     out_dir = Path(os.getenv("DFM_OUTDIR", "data/processed_data"))
@@ -45,21 +61,18 @@ def main() -> None:
     if DRYRUN:
         print("[DRY-RUN] Skipping writes.")
     else:
-        # Try Parquet first (optional engine)
+        # Parquet first (optional engine): write the Arrow table directly, zstd-compressed
         try:
-            X.to_parquet(out_dir / "panel_transformed.parquet")
-        except Exception as e:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
             print(f"[WARN] Parquet write skipped ({e}).")
+        else:
+            pq.write_table(pa.Table.from_pandas(X), out_dir / "panel_transformed.parquet", compression="zstd")
 
-        # Always write CSV (dates rendered as mm/dd/yyyy)
-        X.to_csv(
-            out_dir / "panel_transformed.csv",
-            index=True,
-            index_label="sasdate",
-            date_format="%m/%d/%Y",
-            float_format="%.10g",
-            na_rep="",  # show empty cell for NaN; change to "NA" if preferred
-        )
+        # Always write CSV (dates rendered as mm/dd/yyyy, NaN as empty cell); DFM_ARROW_CSV=1
+        # opts into pyarrow's full-precision writer
+        save_panel_csv(X, out_dir / "panel_transformed.csv", date_fmt="%m/%d/%Y")
         print(f"Saved to: {out_dir}/panel_transformed.parquet (if engine available) and .csv")
 
     # Small summary
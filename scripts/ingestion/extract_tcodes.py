@@ -1,7 +1,8 @@
 from pathlib import Path
-from dfm_pipeline.ingestion.fred_md import extract_tcodes_to_json
 
 if __name__ == "__main__":
+    from dfm_pipeline.ingestion.fred_md import extract_tcodes_to_json
+
     csv_path = Path("data/raw_data/fred_md_current.csv")
     json_path = Path("data/metadata/tcode_map.json")
 
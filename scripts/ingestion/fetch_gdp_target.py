@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
 from pathlib import Path
-import argparse, json, os
+import argparse, os
 from datetime import datetime, UTC
 
 from dotenv import load_dotenv  # pip install python-dotenv
 load_dotenv()  # loads ./.env into environment
 
-from dfm_pipeline.ingestion.fred_client import get_series, to_named_column
-
 SERIES_ID = "A191RL1Q225SBEA"
 OUT_COL   = "gdp_qoq_saar"
 
@@ -21,6 +19,10 @@ def main():
     if not args.api_key:
         raise SystemExit("Set FRED_API_KEY in .env/env or pass --api-key.")
 
+    # Deferred until the key check passes: pulls in pandas + requests
+    from dfm_pipeline.ingestion.fred_client import get_series, to_named_column
+    from dfm_pipeline.utils.cached_config import dump_json
+
     args.out_dir.mkdir(parents=True, exist_ok=True)
 
     # Fetch and rename to a friendly column
@@ -43,7 +45,7 @@ def main():
         "column_name": OUT_COL,
         "source": "api.stlouisfed.org/fred/series/observations",
     }
-    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    dump_json(meta, meta_path)
 
     print(f"Wrote:\n  {csv_path}\n  {meta_path}")
 
@@ -1,45 +1,59 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
+from collections import defaultdict
 from pathlib import Path
+from typing import TYPE_CHECKING
 import argparse
 import sys
-import yaml
-import pandas as pd
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _diff(x: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    return x.diff()
+
+
+def _yoy(x: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    return x.sub(x.shift(12))
 
-def apply_transform(s: pd.Series, kind: str) -> pd.Series:
+
+# Normalized kind -> transform; callers normalize once (strip/lower) before lookup
+_TRANSFORMS = {"diff": _diff, "yoy": _yoy}
+
+
+def apply_transform(s: pd.Series | pd.DataFrame, kind: str) -> pd.Series | pd.DataFrame:
     """
-    Apply a simple extra transform to a single series.
+    Apply a simple extra transform to a single series, or column-wise to a block of series.
+    `kind` is expected already normalized (lower-case, no surrounding whitespace).
 
     Supported:
       - "diff": first difference (x_t - x_{t-1})
       - "yoy" : 12-month difference (x_t - x_{t-12}), preserves units
     """
-    kind = (kind or "").strip().lower()
-    x = pd.to_numeric(s, errors="coerce")
-    if kind == "diff":
-        return x.diff()
-    elif kind == "yoy":
-        return x - x.shift(12)
-    else:
+    import pandas as pd
+
+    fn = _TRANSFORMS.get(kind)
+    if fn is None:
         raise ValueError(f"Unsupported transform '{kind}'. Supported: diff, yoy")
 
+    # Coerce only non-numeric data; numeric columns pass through without a copy
+    if isinstance(s, pd.DataFrame):
+        non_numeric = [c for c in s.columns if not pd.api.types.is_numeric_dtype(s[c])]
+        x = s.assign(**{c: pd.to_numeric(s[c], errors="coerce") for c in non_numeric}) if non_numeric else s
+    else:
+        x = s if pd.api.types.is_numeric_dtype(s) else pd.to_numeric(s, errors="coerce")
+    return fn(x)
+
 
 def load_config(path: Path) -> dict:
-    """Load YAML config with UTF-8; fall back gracefully if needed."""
+    """Load YAML config (UTF-8; BOM/cp1252 tolerated with a warning), memoized on (path, mtime)."""
     if not path.exists():
         sys.exit(f"Config not found: {path}")
+    from dfm_pipeline.utils.cached_config import load_yaml
     try:
-        text = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        # Try UTF-8 with BOM, then cp1252 as a last resort
-        try:
-            text = path.read_text(encoding="utf-8-sig")
-            print("[warn] Read config with UTF-8 BOM; consider re-saving as plain UTF-8.", file=sys.stderr)
-        except UnicodeDecodeError:
-            text = path.read_text(encoding="cp1252")
-            print("[warn] Read config with cp1252; consider re-saving as UTF-8 to avoid surprises.", file=sys.stderr)
-    try:
-        return yaml.safe_load(text) or {}
+        return load_yaml(path)
     except Exception as e:
         sys.exit(f"Failed to parse YAML in {path}: {e}")
 
@@ -77,9 +91,14 @@ def main():
     if not extra:
         sys.exit("No preprocessing.extra_transforms found in config.yaml (nothing to do).")
 
+    import pandas as pd
+    from dfm_pipeline.utils.io import read_csv_fast, save_panel_csv
+
     # Load panel
     try:
-        df = pd.read_csv(in_csv, parse_dates=[date_col], index_col=date_col)
+        df = read_csv_fast(in_csv)
+        df[date_col] = pd.to_datetime(df[date_col], format=date_fmt)
+        df = df.set_index(date_col)
     except Exception as e:
         sys.exit(f"Failed to read input CSV {in_csv}: {e}")
 
@@ -88,17 +107,24 @@ def main():
 
     changed = []
 
-    # Apply transforms
+    # Group columns by transform kind so each kind runs as one block-wise op
+    groups: dict[str, list[str]] = defaultdict(list)
     for col, kind in extra.items():
         if col in df.columns:
-            try:
-                df[col] = apply_transform(df[col], kind)
-                changed.append(f"{col}:{kind}")
-            except Exception as e:
-                print(f"[warn] Failed to transform {col} ({kind}): {e}", file=sys.stderr)
+            groups[(kind or "").strip().lower()].append(col)
         else:
             print(f"[warn] Column '{col}' not found in panel; skipping.", file=sys.stderr)
 
+    # Apply transforms
+    for kind, cols in groups.items():
+        if not cols:
+            continue
+        try:
+            df[cols] = apply_transform(df[cols], kind)
+            changed.extend(f"{col}:{kind}" for col in cols)
+        except Exception as e:
+            print(f"[warn] Failed to transform {', '.join(cols)} ({kind}): {e}", file=sys.stderr)
+
     # Optionally drop the first row if any transformed column became NaN at the first timestamp
     if args.drop_leading_na and not df.empty:
         first_ts = df.index.min()
@@ -107,8 +133,7 @@ def main():
 
     # Write output
     try:
-        out_csv.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(out_csv, date_format=date_fmt, float_format="%.10g")
+        save_panel_csv(df, out_csv, date_fmt=date_fmt, index_label=date_col)
     except Exception as e:
         sys.exit(f"Failed to write output CSV {out_csv}: {e}")
 
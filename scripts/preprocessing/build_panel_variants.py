@@ -4,12 +4,9 @@
 from pathlib import Path
 import argparse
 
-from dfm_pipeline.preprocessing.panel_variants import (
-    ensure_monthly_panel,
-    build_variant,
-    DATE_COL_DEFAULT,
-    DATE_FMT_DEFAULT,
-)
+# Mirrors dfm_pipeline.preprocessing.panel_variants defaults; kept local so --help stays pandas-free
+DATE_COL_DEFAULT = "sasdate"
+DATE_FMT_DEFAULT = "%m/%d/%Y"
 
 DEFAULT_IN_CSV = Path("data/processed_data/panel_transformed.csv")
 
@@ -55,6 +52,9 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     args = parse_args()
 
+    import pandas as pd
+    from dfm_pipeline.preprocessing.panel_variants import ensure_monthly_panel, build_variant
+
     # Load and enforce contiguous monthly index
     df_all = ensure_monthly_panel(args.in_csv, date_col=args.date_col, date_fmt=args.date_fmt)
 
@@ -69,12 +69,20 @@ def main() -> None:
     else:
         variants = DEFAULT_VARIANTS
 
+    # Resolve every anchor to a row position once (index is sorted and monthly)
+    idx = df_all.index
+    starts = {
+        v["name"]: int(idx.searchsorted(pd.to_datetime(v["anchor_start"], format=DATE_FMT_DEFAULT)))
+        for v in variants
+    }
+
     for v in variants:
         meta = build_variant(
             df_all=df_all,
             name=v["name"],
             anchor_start=v["anchor_start"],
             in_csv_path=args.in_csv,
+            start_pos=starts[v["name"]],
         )
 
         arts = meta.get("artifacts", {})
@@ -1,13 +1,6 @@
 # scripts/run_deseasonalization.py
 
 import logging
-import pandas as pd
-from scripts.bootstrap import add_src_to_path
-
-# Add src/ to Python path
-add_src_to_path()
-
-from dfm_pipeline.preprocessing.deseasonalization import deseasonalize_x13, deseasonalize_stl
 
 def setup_logging():
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -15,6 +8,10 @@ def setup_logging():
 def main():
     setup_logging()
 
+    # Deferred: pandas + statsmodels dominate cold start
+    import pandas as pd
+    from dfm_pipeline.preprocessing.deseasonalization import deseasonalize_x13, deseasonalize_stl
+
     file_path = "data/raw/fred_md_current.csv"  # Adjust if needed
     label = "INDPRO"  # Choose the column/series label to test
 
@@ -1,15 +1,6 @@
-import sys
 import os
 import logging
 
-# Add src/ to the Python module search path
-current_dir = os.path.dirname(__file__)
-src_path = os.path.abspath(os.path.join(current_dir, "..", "src"))
-sys.path.append(src_path)
-
-from dfm_pipeline.utils.config_loader import load_config
-from dfm_pipeline.ingestion.downloader import download_csv
-
 def setup_logging():
     """Configure logging to console."""
     logging.basicConfig(
@@ -19,6 +10,7 @@ def setup_logging():
 
 def main():
     setup_logging()
+    from dfm_pipeline.utils.config_loader import load_config
     config = load_config()
 
     # Extract expected filename and build full path
@@ -30,6 +22,8 @@ def main():
         logging.info(f"Raw file already exists at {raw_path}. Skipping download.")
     else:
         logging.info("Raw file not found. Starting download...")
+        # Deferred: requests is only needed when a download actually happens
+        from dfm_pipeline.ingestion.downloader import download_csv
         try:
             download_csv(overwrite=False)
             logging.info("Download completed successfully.")
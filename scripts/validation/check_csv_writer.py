@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Check that fast_to_csv writes the same bytes as DataFrame.to_csv.
+
+Cases: float panels with NaNs, ints/bools, datetime columns, and text that needs CSV
+quoting (comma, quote, newline) in object, category and string columns. Exits 1 on any
+mismatch.
+
+Run:
+  python scripts/validation/check_csv_writer.py
+"""
+
+from __future__ import annotations
+from pathlib import Path
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from dfm_pipeline.utils.io import fast_to_csv
+
+
+def _cases() -> dict[str, pd.DataFrame]:
+    idx = pd.date_range("1960-01-01", periods=4, freq="MS", name="sasdate")
+    rng = np.random.default_rng(0)
+    floats = pd.DataFrame(rng.normal(size=(4, 3)) * [1.0, 1e6, 1e-6], index=idx, columns=["A", "B", "C"])
+    floats.iloc[1, 0] = np.nan
+    text = ["plain", "a,b", 'say "hi"', "two\nlines"]
+    return {
+        "floats": floats,
+        "ints_bools": pd.DataFrame({"n": [1, 2, 3, 4], "flag": [True, False, True, False]}, index=idx),
+        "dates": pd.DataFrame({"d": idx.shift(1), "x": [1.5, np.nan, 2.5, 3.5]}, index=idx),
+        "object_text": pd.DataFrame({"s": text}, index=idx),
+        "category_text": pd.DataFrame({"s": pd.Categorical(text)}, index=idx),
+        "string_text": pd.DataFrame({"s": pd.array(text, dtype="string")}, index=idx),
+        "category_comma_only": pd.DataFrame({"s": pd.Categorical(["a,b", "c", "a,b", None])}, index=idx),
+    }
+
+
+def main() -> None:
+    bad = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, df in _cases().items():
+            got, want = Path(tmp, f"{name}_fast.csv"), Path(tmp, f"{name}_pandas.csv")
+            fast_to_csv(df, got, date_fmt="%m/%d/%Y", float_fmt="%.10g", index_label="sasdate")
+            df.to_csv(want, index_label="sasdate", date_format="%m/%d/%Y", float_format="%.10g", na_rep="")
+            same = got.read_bytes() == want.read_bytes()
+            print(f"{name:20s}: {'OK' if same else 'MISMATCH'}")
+            bad += not same
+    if bad:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
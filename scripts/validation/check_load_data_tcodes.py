@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Check the t-codes returned by load_data against the ingestion extractor.
+
+load_data takes the codes from file row 1 of the raw CSV; this confirms detect_tcode_row
+finds them there, and that the Series (float64, indexed by series name in header order)
+holds the same codes as extract_tcodes_to_json. Exits 1 on any mismatch.
+
+Run (from the project root, next to config.yaml):
+  python scripts/validation/check_load_data_tcodes.py
+"""
+
+from __future__ import annotations
+from pathlib import Path
+import sys
+import tempfile
+
+from dfm_pipeline.ingestion.fred_md import detect_tcode_row, extract_tcodes_to_json
+from dfm_pipeline.utils.data_loader import data_path, load_data, load_headers
+
+
+def main() -> None:
+    path = Path(data_path("raw"))
+    _, codes = load_data(stage="raw")
+    with tempfile.TemporaryDirectory() as tmp:
+        tcode_map, _ = extract_tcodes_to_json(path, Path(tmp) / "tcode_map.json", write_sidecar_metadata=False)
+
+    problems: list[str] = []
+    row = detect_tcode_row(path)
+    if row != 1:
+        problems.append(f"detect_tcode_row found the t-codes in row {row}; load_data reads row 1")
+    if codes.dtype != "float64":
+        problems.append(f"transform_codes dtype is {codes.dtype}, expected float64")
+    header = [c for c in load_headers(str(path)) if c != "sasdate"]
+    if list(codes.index) != header:
+        problems.append("transform_codes index does not match the CSV header order")
+    differ = {k: (codes.get(k), v) for k, v in tcode_map.items() if codes.get(k) != v}
+    if differ:
+        problems.append(f"codes differ from extract_tcodes_to_json (load_data, extractor): {differ}")
+
+    print(f"== {path} == series={len(codes)} extractor_series={len(tcode_map)}")
+    if problems:
+        print("\n[TCODES FAIL]")
+        for p in problems:
+            print(" -", p)
+        sys.exit(1)
+    print("\n[TCODES OK]")
+
+
+if __name__ == "__main__":
+    main()
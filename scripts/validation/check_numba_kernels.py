@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Check the optional Numba kernels against their NumPy fallbacks.
+
+Kernels covered:
+  • t-code transforms 1–7 (preprocessing.tcode), inputs with NaNs, zeros and negatives
+  • leading / interior gap scan (preprocessing.panel_variants)
+  • missing-run statistics (validation.panel_missing_diagnostics)
+
+Results must agree exactly (NaN == NaN). Exits 1 on any mismatch; exits 0 with a note when
+numba is not installed, since only the NumPy paths run then.
+
+Run:
+  python scripts/validation/check_numba_kernels.py --trials 50
+"""
+
+from __future__ import annotations
+import argparse
+import sys
+
+import numpy as np
+
+from dfm_pipeline.preprocessing import panel_variants, tcode
+from dfm_pipeline.validation import panel_missing_diagnostics as pmd
+
+
+def _masks(rng: np.random.Generator, trials: int):
+    """Random boolean masks plus the edge shapes: empty, no columns, all True, all False."""
+    yield np.zeros((0, 3), dtype=bool)
+    yield np.zeros((5, 0), dtype=bool)
+    yield np.ones((7, 3), dtype=bool)
+    yield np.zeros((7, 3), dtype=bool)
+    for _ in range(trials):
+        T, N = int(rng.integers(1, 60)), int(rng.integers(1, 12))
+        yield rng.random((T, N)) < rng.uniform(0.05, 0.95)
+
+
+def _values(rng: np.random.Generator, trials: int):
+    """Random panels mixing positive levels, zeros, negatives and NaNs (incl. leading NaNs)."""
+    yield np.zeros((0, 7))
+    yield np.array([[1.0, 0.0, -1.0, np.nan, 2.0, 3.0, 0.5]])
+    for _ in range(trials):
+        T, N = int(rng.integers(2, 60)), int(rng.integers(7, 21))
+        x = rng.lognormal(0.0, 1.0, size=(T, N))
+        x[rng.random((T, N)) < 0.1] = 0.0
+        x[rng.random((T, N)) < 0.1] *= -1.0
+        x[rng.random((T, N)) < 0.1] = np.nan
+        x[: int(rng.integers(0, 3)), 0] = np.nan
+        yield x
+
+
+def _same(a: np.ndarray, b: np.ndarray) -> bool:
+    return a.shape == b.shape and np.array_equal(a, b, equal_nan=a.dtype.kind == "f")
+
+
+def check_run_stats(rng: np.random.Generator, trials: int) -> int:
+    kernel = pmd._run_stats_kernel()
+    bad = 0
+    for mask in _masks(rng, trials):
+        got, want = kernel(mask), pmd._run_stats_numpy(mask)
+        if not all(_same(np.asarray(g), w) for g, w in zip(got, want)):
+            print(f"[FAIL] run stats differ for mask of shape {mask.shape}")
+            bad += 1
+    return bad
+
+
+def check_gap_stats(rng: np.random.Generator, trials: int) -> int:
+    kernel = panel_variants._gap_stats_kernel()
+    bad = 0
+    for valid in _masks(rng, trials):
+        if valid.shape[0] == 0:
+            continue  # handled before dispatch in _column_gap_stats
+        got = kernel(np.asfortranarray(valid))
+        want = panel_variants._column_gap_stats_numpy(valid)
+        if not all(_same(np.asarray(g), np.asarray(w, dtype=np.int64)) for g, w in zip(got, want)):
+            print(f"[FAIL] gap stats differ for mask of shape {valid.shape}")
+            bad += 1
+    return bad
+
+
+def check_tcodes(rng: np.random.Generator, trials: int) -> int:
+    kernel = tcode._tcode_kernel()
+    bad = 0
+    for values in _values(rng, trials):
+        codes = np.resize(np.arange(1, 8, dtype=np.int64), values.shape[1])
+        rng.shuffle(codes)
+        blocks, logged, _ = tcode._code_plan(codes.tobytes())
+        got = np.empty_like(values)
+        want = np.empty_like(values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tcode._transform_compiled(kernel, values, codes, logged, got)
+            tcode._transform_blocks(values, blocks, want)
+        got[np.isinf(got)] = np.nan
+        want[np.isinf(want)] = np.nan
+        for j in range(values.shape[1]):
+            if not _same(got[:, j], want[:, j]):
+                print(f"[FAIL] t-code {codes[j]} differs (panel shape {values.shape}, column {j})")
+                bad += 1
+    return bad
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Compare Numba kernels with their NumPy fallbacks.")
+    ap.add_argument("--trials", type=int, default=50, help="Random inputs per kernel.")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    if tcode._tcode_kernel() is None:
+        print("[INFO] numba not installed; only the NumPy paths are in use, nothing to compare.")
+        sys.exit(0)
+
+    rng = np.random.default_rng(args.seed)
+    failures = {
+        "run stats": check_run_stats(rng, args.trials),
+        "gap stats": check_gap_stats(rng, args.trials),
+        "t-codes": check_tcodes(rng, args.trials),
+    }
+    for name, n in failures.items():
+        print(f"{name:10s}: {'OK' if n == 0 else f'{n} mismatch(es)'}")
+    if any(failures.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,38 @@
 #!/usr/bin/env python3
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import argparse
+import os
 
-from dfm_pipeline.utils import load_panel_csv, ensure_monthly_index, clean_columns
-from dfm_pipeline.validation.stationarity import panel_stationarity
+from dfm_pipeline.utils.parallel import limit_worker_threads
+
+
+def _run_one(p: Path, opts: dict) -> str:
+    """Load one panel, run the tests, write the summary CSV; return the console line."""
+    # Deferred: statsmodels/pandas dominate cold start (and load per worker process)
+    from dfm_pipeline.utils import load_panel_csv, ensure_monthly_index, clean_columns
+    from dfm_pipeline.validation.stationarity import run_stationarity_tests_on_panel
+
+    df = load_panel_csv(p, date_fmt=opts["date_fmt"])
+    df = ensure_monthly_index(df)
+    df = clean_columns(df)
+
+    res = run_stationarity_tests_on_panel(
+        df,
+        kpss_reg=opts["kpss_reg"],
+        alpha=opts["alpha"],
+        run_pp=opts["pp"],
+        run_dfgls=opts["dfgls"],
+        run_za=opts["za"],
+        pp_trend=opts["pp_trend"],
+        dfgls_trend=opts["dfgls_trend"],
+        za_trends=(opts["za_reg"],),
+    )
+    out = opts["out_dir"] / f"{p.stem}_stationarity.csv"
+    res.to_csv(out, float_format="%.6g")
+
+    counts = res["decision"].value_counts(dropna=False).to_dict()
+    return f"[{p.name}] rows={len(df):,} cols={df.shape[1]}  decisions={counts}  -> {out}"
 
 
 def main():
@@ -20,31 +49,24 @@ def main():
     ap.add_argument("--pp-trend", default="c", choices=["n","c","ct"])
     ap.add_argument("--dfgls-trend", default="c", choices=["c","ct"])
     ap.add_argument("--za-reg", default="c", choices=["c","t","ct"])
+    ap.add_argument("--jobs", type=int, default=None,
+                    help="Worker processes for multiple CSVs (default: min(#CSVs, CPU count))")
     args = ap.parse_args()
 
     args.out_dir.mkdir(parents=True, exist_ok=True)
+    opts = {k: v for k, v in vars(args).items() if k not in ("csvs", "jobs")}
+
+    # Each CSV is independent and CPU-bound (ADF/KPSS per column): one process per file
+    jobs = args.jobs or min(len(args.csvs), os.cpu_count() or 1)
+    if jobs <= 1 or len(args.csvs) == 1:
+        for p in args.csvs:
+            print(_run_one(p, opts))
+        return
 
-    for p in args.csvs:
-        df = load_panel_csv(p, date_fmt=args.date_fmt)
-        df = ensure_monthly_index(df)
-        df = clean_columns(df)
-
-        res = panel_stationarity(
-            df,
-            kpss_reg=args.kpss_reg,
-            alpha=args.alpha,
-            run_pp=args.pp,
-            run_dfgls=args.dfgls,
-            run_za=args.za,
-            pp_trend=args.pp_trend,
-            dfgls_trend=args.dfgls_trend,
-            za_reg=args.za_reg,
-        )
-        out = args.out_dir / f"{p.stem}_stationarity.csv"
-        res.to_csv(out, float_format="%.6g")
-
-        counts = res["decision"].value_counts(dropna=False).to_dict()
-        print(f"[{p.name}] rows={len(df):,} cols={df.shape[1]}  decisions={counts}  -> {out}")
+    with ProcessPoolExecutor(max_workers=jobs, initializer=limit_worker_threads) as ex:
+        futures = [ex.submit(_run_one, p, opts) for p in args.csvs]
+        for f in as_completed(futures):
+            print(f.result())
 
 
 if __name__ == "__main__":
@@ -2,10 +2,6 @@
 from pathlib import Path
 import argparse
 import sys
-import pandas as pd
-
-# uses your existing utilities
-from dfm_pipeline.validation.stationarity import run_stationarity_tests_on_series
 
 
 def main():
@@ -14,6 +10,8 @@ def main():
     )
     ap.add_argument("csv", type=Path, help="Path to target CSV (with date and value columns).")
     ap.add_argument("--date-col", default="sasdate", help="Date column name (default: sasdate).")
+    ap.add_argument("--date-fmt", default="%Y-%m-%d",
+                    help="Date format of the date column (default: %%Y-%%m-%%d, as written by fetch_gdp_target).")
     ap.add_argument("--value-col", default="gdp_qoq_saar", help="Value column name to test.")
     ap.add_argument("--out-dir", type=Path, default=Path("data/quality_checks/stationarity_target"),
                     help="Directory to write the summary CSV.")
@@ -37,16 +35,25 @@ def main():
     if not args.csv.exists():
         sys.exit(f"CSV not found: {args.csv}")
 
+    import pandas as pd
+    # uses your existing utilities
+    from dfm_pipeline.validation.stationarity import run_stationarity_tests_on_series
+
+    from dfm_pipeline.utils.data_loader import load_headers
+
+    # Check the header first, then parse only the two columns we need
+    columns = load_headers(args.csv)
+    if args.value_col not in columns:
+        sys.exit(f"Column '{args.value_col}' not found in {args.csv}. "
+                 f"Available: {columns}")
+
     # Load the target series
     try:
-        df = pd.read_csv(args.csv, parse_dates=[args.date_col])
+        df = pd.read_csv(args.csv, usecols=[args.date_col, args.value_col],
+                         parse_dates=[args.date_col], date_format=args.date_fmt)
     except Exception as e:
         sys.exit(f"Failed to read {args.csv}: {e}")
 
-    if args.value_col not in df.columns:
-        sys.exit(f"Column '{args.value_col}' not found in {args.csv}. "
-                 f"Available: {df.columns.tolist()}")
-
     s = (df.set_index(args.date_col)[args.value_col]).dropna()
     if s.empty:
         sys.exit("Series is empty after parsing and dropping NaNs.")
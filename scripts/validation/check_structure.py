@@ -15,6 +15,7 @@ Run:
 """
 
 from __future__ import annotations
+from collections import Counter
 from pathlib import Path
 import argparse
 import sys
@@ -22,20 +23,24 @@ import pandas as pd
 
 # If you created the utils as discussed:
 try:
-    from dfm_pipeline.utils import load_panel_csv, ensure_monthly_index, clean_columns
+    from dfm_pipeline.utils import ensure_monthly_index, clean_columns
+    from dfm_pipeline.utils.io import load_panel_prefer_parquet
 except Exception:
-    load_panel_csv = None  # fallback to local robust loader if utils not available
+    load_panel_prefer_parquet = None  # fallback to local robust loader if utils not available
 
 DATE_COL = "sasdate"
 
 def _load_csv(path: Path, date_fmt: str) -> pd.DataFrame:
-    """Robust loader that works whether sasdate is index or column."""
-    if load_panel_csv is not None:
-        return load_panel_csv(path, date_fmt=date_fmt)
+    """
+    Robust loader that works whether sasdate is index or column. Reads a fresh `.parquet`
+    sibling instead of the CSV when there is one; df.attrs["source"] names the file read.
+    """
+    if load_panel_prefer_parquet is not None:
+        return load_panel_prefer_parquet(path, date_fmt=date_fmt)
 
     # Fallback (kept minimal)
     try:
-        df = pd.read_csv(path, parse_dates=[DATE_COL], index_col=DATE_COL)
+        df = pd.read_csv(path, parse_dates=[DATE_COL], date_format=date_fmt, index_col=DATE_COL)
     except Exception:
         df = pd.read_csv(path)
         if DATE_COL not in df.columns:
@@ -45,14 +50,17 @@ def _load_csv(path: Path, date_fmt: str) -> pd.DataFrame:
             bad = df.loc[df[DATE_COL].isna()].index[:5].tolist()
             raise ValueError(f"{path}: some dates failed to parse with {date_fmt}. First bad rows: {bad}")
         df = df.set_index(DATE_COL)
-    df = df.sort_index()
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
     df.index.name = DATE_COL
+    df.attrs["source"] = str(path)
     return df
 
 def check_structure(csv_path: Path, date_fmt: str, enforce_monthly_grid: bool) -> int:
     """Return 0 if OK, 1 on structural failure."""
     problems: list[str] = []
     df = _load_csv(csv_path, date_fmt=date_fmt)
+    source = df.attrs.get("source", str(csv_path))  # CSV or its Parquet sibling
 
     # 1) Index hygiene
     if not isinstance(df.index, pd.DatetimeIndex):
@@ -63,8 +71,12 @@ def check_structure(csv_path: Path, date_fmt: str, enforce_monthly_grid: bool) -
         problems.append("Index not sorted ascending.")
 
     # 2) Enforce monthly MS grid (or at least report gaps)
-    idx = pd.DatetimeIndex(df.index).sort_values()
-    full = pd.date_range(idx.min(), idx.max(), freq="MS")
+    # The loaders return a sorted DatetimeIndex: use it as-is (no copy + re-sort)
+    idx = df.index if df.index.is_monotonic_increasing else df.index.sort_values()
+    if len(idx):
+        full = pd.date_range(idx[0], idx[-1], freq="MS")
+    else:
+        full = pd.DatetimeIndex([], name=DATE_COL)
     missing_rows = full.difference(idx)
     if enforce_monthly_grid:
         # Reindex; we only *report* here (no file writes)
@@ -79,9 +91,9 @@ def check_structure(csv_path: Path, date_fmt: str, enforce_monthly_grid: bool) -
     if clean_columns is not None:
         df.columns = [c.strip().replace(" ", "_") for c in df.columns]
     # Duplicates?
-    dup = df.columns[df.columns.duplicated()]
-    if len(dup) > 0:
-        problems.append(f"Duplicate column names: {sorted(set(dup.tolist()))[:6]}{'...' if len(dup)>6 else ''}")
+    dup = [c for c, k in Counter(df.columns).items() if k > 1]  # one hash pass, first-seen order
+    if dup:
+        problems.append(f"Duplicate column names: {dup[:6]}{'...' if len(dup)>6 else ''}")
 
     # 4) Dtypes: numeric-only
     non_numeric = [c for c in df.columns if not pd.api.types.is_numeric_dtype(df[c])]
@@ -94,6 +106,8 @@ def check_structure(csv_path: Path, date_fmt: str, enforce_monthly_grid: bool) -
 
     # ---- Report ----
     print(f"\n== {csv_path} ==")
+    print(f"validated_file={source}"
+          + (" (Parquet sibling, not the CSV)" if source != str(csv_path) else ""))
     print(f"rows={len(df):,} cols={df.shape[1]} "
           f"start={df.index.min().date() if len(df) else 'NA'} "
           f"end={df.index.max().date() if len(df) else 'NA'}")
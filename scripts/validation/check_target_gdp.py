@@ -4,7 +4,7 @@ Structure-only checks for a quarterly target CSV (e.g., BEA/FRED A191RL1Q225SBEA
 
 Validates:
   • 'sasdate' column parses to datetimes and is strictly increasing with unique timestamps
-  • All dates correspond to quarter-end months (Mar, Jun, Sep, Dec)
+  • All dates fall on a quarter's first or last month (FRED labels quarters Jan/Apr/Jul/Oct)
   • Target value column exists and is numeric (coercible to float)
   • Prints a compact report; exits 0 on OK, 1 on failure
 
@@ -19,15 +19,17 @@ import argparse
 import sys
 import pandas as pd
 
+from dfm_pipeline.utils.io import read_csv_fast
+
 DATE_COL = "sasdate"
-QE_MONTHS = {3, 6, 9, 12}  # quarter-end months
 
 def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser(description="Check structure of a quarterly GDP target CSV")
     ap.add_argument("csv", type=Path, help="Path to target CSV (e.g., A191RL1Q225SBEA_latest.csv)")
     ap.add_argument("--value-col", help="Name of the value column (default: auto-detect: first non-sasdate column)")
     ap.add_argument("--date-fmt", default=None,
-                    help="Optional explicit date format for 'sasdate' (e.g., %%Y-%%m-%%d). If omitted, pandas infers.")
+                    help="Optional explicit date format for 'sasdate'. If omitted, %%Y-%%m-%%d is tried first, "
+                         "then pandas infers.")
     return ap.parse_args()
 
 def main() -> None:
@@ -36,7 +38,13 @@ def main() -> None:
 
     # --- Load ---
     try:
-        df = pd.read_csv(p)
+        try:
+            # With an explicit value column, skip everything else at tokenize time
+            usecols = [DATE_COL, args.value_col] if args.value_col else None
+            df = read_csv_fast(p, date_col=DATE_COL, usecols=usecols)  # dates stay text; parsed below
+        except ValueError:
+            # A requested column is missing: read everything so the checks below can report it
+            df = read_csv_fast(p, date_col=DATE_COL)
     except Exception as e:
         print(f"[FAIL] Could not read CSV: {p}\n  -> {e}")
         sys.exit(1)
@@ -51,7 +59,11 @@ def main() -> None:
         if args.date_fmt:
             df[DATE_COL] = pd.to_datetime(df[DATE_COL], format=args.date_fmt, errors="raise")
         else:
-            df[DATE_COL] = pd.to_datetime(df[DATE_COL], errors="raise")
+            # Targets are written as ISO dates (fetch_gdp_target); infer only if that fails
+            try:
+                df[DATE_COL] = pd.to_datetime(df[DATE_COL], format="%Y-%m-%d", errors="raise")
+            except (ValueError, TypeError):
+                df[DATE_COL] = pd.to_datetime(df[DATE_COL], errors="raise")
     except Exception as e:
         problems.append(f"Failed to parse '{DATE_COL}': {e}")
 
@@ -85,11 +97,13 @@ def main() -> None:
     if not df[DATE_COL].is_monotonic_increasing:
         problems.append("Dates are not strictly increasing.")
 
-    # Quarter-end check
-    q_end_months = df[DATE_COL].dt.to_period("Q").asfreq("M").dt.month
-    if not q_end_months.isin(QE_MONTHS).all():
-        bad_rows = df.loc[~q_end_months.isin(QE_MONTHS), DATE_COL].dt.strftime("%Y-%m-%d").head(5).tolist()
-        problems.append(f"Found non-quarter-end dates (examples: {bad_rows}).")
+    # Quarter-alignment check: one integer modulus over the months (no Period round-trip).
+    # FRED labels a quarter by its first month; quarter-end labels are accepted too.
+    months = df[DATE_COL].dt.month.to_numpy()
+    ok = (months % 3) != 2  # rejects mid-quarter months (Feb, May, Aug, Nov)
+    if not ok.all():
+        bad_rows = df.loc[~ok, DATE_COL].dt.strftime("%Y-%m-%d").head(5).tolist()
+        problems.append(f"Found dates not aligned to a quarter start/end month (examples: {bad_rows}).")
 
     # Numeric values check
     non_numeric_count = None
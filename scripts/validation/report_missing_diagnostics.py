@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-import argparse, json
-import pandas as pd
+from typing import TYPE_CHECKING
+import argparse, os
+
+from dfm_pipeline.utils.parallel import limit_worker_threads
 
-from dfm_pipeline.validation.panel_missing_diagnostics import (
-    compute_missingness_by_series,
-    save_positions_jsonl,
-    missing_positions_by_series,
-    missing_runs_by_series,
-)
+if TYPE_CHECKING:
+    import pandas as pd
 
 DATE_FMT = "%m/%d/%Y"  # mm/dd/yyyy
 DEFAULT_META_DIR = Path("data/metadata")
@@ -16,16 +18,13 @@ DEFAULT_QC_DIR   = Path("data/quality_checks")
 
 
 def load_panel(p: Path) -> pd.DataFrame:
-    """Load panel with DatetimeIndex on 'sasdate' from either CSV style."""
-    # Try index-labeled style first
+    """Load panel with DatetimeIndex on 'sasdate' (fresh .parquet sibling, else Arrow CSV read)."""
+    from dfm_pipeline.utils.io import load_panel_prefer_parquet
+
     try:
-        return pd.read_csv(p, parse_dates=["sasdate"], index_col="sasdate").sort_index()
-    except Exception:
-        df = pd.read_csv(p)
-        if "sasdate" not in df.columns:
-            raise SystemExit(f"{p}: 'sasdate' not found as column or index.")
-        df["sasdate"] = pd.to_datetime(df["sasdate"], format=DATE_FMT, errors="coerce")
-        return df.set_index("sasdate").sort_index()
+        return load_panel_prefer_parquet(p, date_fmt=DATE_FMT)
+    except ValueError:
+        raise SystemExit(f"{p}: 'sasdate' not found as column or index.") from None
 
 
 def parse_args() -> argparse.Namespace:
@@ -50,12 +49,38 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_QC_DIR,
         help=f"Directory for QC CSVs/JSONL (default: {DEFAULT_QC_DIR})"
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for multiple CSVs (default: min(#CSVs, CPU count))"
+    )
     return ap.parse_args()
 
 
+def _stem(p: Path) -> str:
+    """Artifact stem; both CSV styles of a panel share one."""
+    return p.stem.replace("_sasdate_column", "")  # normalize if needed
+
+
+def _run_group(paths: list[Path], meta_dir: Path, qc_dir: Path) -> None:
+    """Run CSVs that share an artifact stem one after another (last one wins, as before)."""
+    for p in paths:
+        run_one(p, meta_dir, qc_dir)
+
+
 def run_one(in_csv: Path, meta_dir: Path, qc_dir: Path) -> None:
+    from dfm_pipeline.utils.cached_config import dump_json
+    from dfm_pipeline.utils.io import fast_to_csv
+    from dfm_pipeline.validation.panel_missing_diagnostics import (
+        compute_missingness_by_series,
+        save_positions_jsonl,
+        missing_positions_by_series,
+        missing_runs_by_series,
+    )
+
     df = load_panel(in_csv)
-    stem = in_csv.stem.replace("_sasdate_column", "")  # normalize if needed
+    stem = _stem(in_csv)
 
     meta_dir.mkdir(parents=True, exist_ok=True)
     qc_dir.mkdir(parents=True, exist_ok=True)
@@ -63,22 +88,21 @@ def run_one(in_csv: Path, meta_dir: Path, qc_dir: Path) -> None:
     # 1) Boundary-style summary
     by_series, summary = compute_missingness_by_series(df, date_format=DATE_FMT)
     by_series_path = qc_dir / f"{stem}_missing_by_series.csv"
-    by_series.to_csv(by_series_path, float_format="%.10g")
+    fast_to_csv(by_series, by_series_path, date_fmt=None, float_fmt="%.10g", index_label=None)
 
     summary_path = meta_dir / f"{stem}_missing_summary.json"
-    with summary_path.open("w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    dump_json(summary, summary_path)
 
     # 2) Exact missing dates
     pos_summary, positions = missing_positions_by_series(df, as_strings=True, date_format=DATE_FMT)
     pos_summary_path = qc_dir / f"{stem}_missing_positions_summary.csv"
-    pos_summary.to_csv(pos_summary_path, index=True)
+    fast_to_csv(pos_summary, pos_summary_path, date_fmt=None, float_fmt=None, index_label=None)
     pos_jsonl_path = save_positions_jsonl(positions, qc_dir / f"{stem}_missing_positions.jsonl")
 
     # 3) Contiguous runs
     runs = missing_runs_by_series(df, as_strings=True, date_format=DATE_FMT)
     runs_path = qc_dir / f"{stem}_missing_runs.csv"
-    runs.to_csv(runs_path, index=False)
+    fast_to_csv(runs, runs_path, date_fmt=None, float_fmt=None, index=False)
 
     # 4) Small catalog
     catalog = {
@@ -96,8 +120,7 @@ def run_one(in_csv: Path, meta_dir: Path, qc_dir: Path) -> None:
         },
     }
     catalog_path = meta_dir / f"{stem}_panel_missing_catalog.json"
-    with catalog_path.open("w", encoding="utf-8") as f:
-        json.dump(catalog, f, indent=2)
+    dump_json(catalog, catalog_path)
 
     print(f"[{stem}] rows={df.shape[0]} cols={df.shape[1]} -> QC:{qc_dir}  META:{meta_dir}")
 
@@ -107,7 +130,21 @@ def main() -> None:
     for p in args.csvs:
         if not p.exists():
             raise SystemExit(f"Input not found: {p}")
-        run_one(p, args.meta_dir, args.qc_dir)
+
+    # Each CSV is independent (own read + missingness scans): one process per file
+    jobs = args.jobs or min(len(args.csvs), os.cpu_count() or 1)
+    if jobs <= 1 or len(args.csvs) == 1:
+        for p in args.csvs:
+            run_one(p, args.meta_dir, args.qc_dir)
+        return
+
+    # Inputs writing the same artifacts stay in one task so they never race on a file
+    groups: dict[str, list[Path]] = {}
+    for p in args.csvs:
+        groups.setdefault(_stem(p), []).append(p)
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(groups)), initializer=limit_worker_threads) as ex:
+        list(ex.map(partial(_run_group, meta_dir=args.meta_dir, qc_dir=args.qc_dir), groups.values()))
 
 
 if __name__ == "__main__":
@@ -1,23 +1,101 @@
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import logging
+import warnings
 
 from dfm_pipeline.utils.data_loader import load_data
 
 
+def describe_numeric(df: pd.DataFrame) -> tuple[pd.Series, pd.DataFrame]:
+    """
+    Missing counts per column and a describe()-style table for the numeric columns.
+
+    Numeric columns are reduced on one float64 array (NaN-aware NumPy reductions) instead of
+    pandas' per-column describe(); other columns only get their missing counts, via pandas.
+    """
+    num = df.select_dtypes("number")
+    X = num.to_numpy(dtype=np.float64)
+    nan = np.isnan(X)
+
+    nulls = pd.Series(0, index=df.columns, dtype=np.int64)
+    nulls[num.columns] = nan.sum(axis=0)
+    other = df.columns.difference(num.columns, sort=False)
+    if len(other):
+        nulls[other] = df[other].isnull().sum()
+
+    count = (~nan).sum(axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN / single-obs columns → NaN
+        q = np.nanpercentile(X, [25, 50, 75], axis=0)
+        stats = np.vstack([
+            count,
+            np.nanmean(X, axis=0),
+            np.nanstd(X, axis=0, ddof=1),
+            np.nanmin(X, axis=0),
+            q,
+            np.nanmax(X, axis=0),
+        ])
+    desc = pd.DataFrame(
+        stats, index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"], columns=num.columns
+    )
+    return nulls, desc
+
+
 def summarize_data(df: pd.DataFrame):
     """Print basic summary statistics and structure."""
+    nulls, desc = describe_numeric(df)
     print("Data shape:", df.shape)
-    print("\nMissing values:\n", df.isnull().sum())
+    print("\nMissing values:\n", nulls)
     print("\nData types:\n", df.dtypes)
-    print("\nDescriptive stats:\n", df.describe())
+    print("\nDescriptive stats:\n", desc)
+
+
+def correlation_matrix(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pearson correlations of the numeric columns, using pairwise-complete observations
+    (same definition as DataFrame.corr()).
+
+    Complete panels go straight to np.corrcoef. Ragged ones are swept one column at a time
+    against all later columns: each pair is centered on its own overlap means before the
+    products are summed (two-pass, like pandas), so large levels don't cancel away digits.
+    """
+    num = df.select_dtypes("number")
+    X = num.to_numpy(dtype=np.float64)
+    mask = ~np.isnan(X)
+    # Rescale each column by a power of two (exact) so squared deviations cannot overflow
+    peak = np.where(mask & np.isfinite(X), np.abs(X), 0.0).max(axis=0, initial=0.0)
+    X = np.ldexp(X, -np.frexp(peak)[1])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if mask.all():
+            C = np.corrcoef(X, rowvar=False)
+        else:
+            N = X.shape[1]
+            C = np.full((N, N), np.nan)
+            for i in range(N):
+                w = mask[:, i:] & mask[:, [i]]     # rows where both i and j are observed
+                n = w.sum(axis=0)
+                xi = np.where(w, X[:, [i]], 0.0)
+                xj = np.where(w, X[:, i:], 0.0)
+                dx = np.where(w, xi - xi.sum(axis=0) / n, 0.0)
+                dy = np.where(w, xj - xj.sum(axis=0) / n, 0.0)
+                r = (dx * dy).sum(axis=0) / np.sqrt((dx * dx).sum(axis=0) * (dy * dy).sum(axis=0))
+                r[n < 2] = np.nan
+                C[i, i:] = r
+                C[i:, i] = r
+    C = np.clip(C, -1.0, 1.0)
+    np.fill_diagonal(C, np.where(np.isnan(np.diag(C)), np.nan, 1.0))
+    return pd.DataFrame(C, index=num.columns, columns=num.columns)
 
 
 def plot_correlation_heatmap(df: pd.DataFrame):
     """Plot a heatmap of variable correlations."""
+    # Plotting stack imported on use: matplotlib/seaborn are heavy to load
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     plt.figure(figsize=(12, 10))
-    sns.heatmap(df.corr(), cmap="coolwarm", center=0)
+    sns.heatmap(correlation_matrix(df), cmap="coolwarm", center=0)
     plt.title("Correlation Heatmap")
     plt.tight_layout()
     plt.show()
@@ -25,6 +103,8 @@ def plot_correlation_heatmap(df: pd.DataFrame):
 
 def plot_timeseries_sample(df: pd.DataFrame, num_vars: int = 6):
     """Plot a few time series for visual inspection."""
+    import matplotlib.pyplot as plt
+
     df.iloc[:, :num_vars].plot(subplots=True, figsize=(10, 8), linewidth=1)
     plt.suptitle(f"First {num_vars} Variables Over Time")
     plt.tight_layout()
@@ -8,7 +8,7 @@ def download_csv(overwrite: bool = False) -> str:
     Download a CSV file using URL and filename from config.yaml,
     and save it to the data/raw_data/ folder.
 
-    If the folder does not exist, it is created.
+    The folder is created if needed.
     If the file exists and overwrite=False, the download is skipped.
 
     Args:
@@ -24,26 +24,28 @@ def download_csv(overwrite: bool = False) -> str:
     save_dir = os.path.join("data", "raw_data")
     save_path = os.path.join(save_dir, filename)
 
-    # Ensure the directory exists
-    if not os.path.exists(save_dir):
-        os.makedirs(save_dir)
-        logging.info(f"Created directory: {save_dir}")
-    else:
-        logging.info(f"Directory already exists: {save_dir}")
+    # Ensure the directory exists (single race-free call; no-op when it is already there)
+    os.makedirs(save_dir, exist_ok=True)
 
     # Check if file already exists
     if os.path.exists(save_path) and not overwrite:
         logging.info(f"File already exists at {save_path}. Skipping download.")
         return save_path
 
-    # Download file
+    # Download file: stream to a temporary file in 1 MiB chunks (constant memory), then
+    # move it into place so an interrupted transfer never leaves a truncated CSV behind
     logging.info(f"Downloading data from {url}...")
-    response = requests.get(url)
-
-    if response.status_code == 200:
-        with open(save_path, 'wb') as f:
-            f.write(response.content)
-        logging.info(f"Download complete: {save_path}")
-        return save_path
-    else:
-        raise Exception(f"Download failed with status code: {response.status_code}")
+    tmp_path = save_path + ".part"
+    try:
+        with requests.get(url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+        os.replace(tmp_path, save_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    logging.info(f"Download complete: {save_path}")
+    return save_path
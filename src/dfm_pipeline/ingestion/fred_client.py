@@ -1,19 +1,127 @@
 # src/dfm_pipeline/ingestion/fred_client.py
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable
+import threading
+import time
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: Arrow's vectorized string -> float64 cast for observation values
+try:
+    import pyarrow as pa  # type: ignore[import-not-found]
+    import pyarrow.compute as pc  # type: ignore[import-not-found]
+    _HAVE_PYARROW = True
+except Exception:
+    _HAVE_PYARROW = False
+
+# Optional faster JSON decoder for observation payloads; Response.json() is the fallback
+try:
+    import orjson  # type: ignore[import-not-found]
+    _HAVE_ORJSON = True
+except Exception:
+    _HAVE_ORJSON = False
 
 __all__ = [
     "API_URL_DEFAULT",
     "get_series",
+    "get_series_many",
     "to_named_column",
 ]
 
 # Official observations endpoint (JSON)
 API_URL_DEFAULT = "https://api.stlouisfed.org/fred/series/observations"
 
+# FRED API rate limit
+FRED_MAX_REQUESTS_PER_MINUTE = 120
+
+
+def _make_session() -> requests.Session:
+    """Keep-alive session with a pooled adapter; transient 429/5xx GETs are retried with backoff."""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across get_series calls so the TCP/TLS handshake is paid once per host
+_SESSION = _make_session()
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: bursts of up to `capacity` calls, refilled at `rate` per second."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate, self.capacity = rate, capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Burst + refill sized so that no 60 s window exceeds FRED's per-minute limit
+_BURST = 10
+_RATE_LIMITER = _TokenBucket(rate=(FRED_MAX_REQUESTS_PER_MINUTE - _BURST) / 60.0, capacity=_BURST)
+
+# 'YYYY-MM-DD' token -> Timestamp, shared across calls: vintages of a series repeat the
+# same observation dates, so a batch of get_series calls parses each date only once.
+_ISO_DATE_CACHE: Dict[str, pd.Timestamp] = {}
+
+
+def _obs_value(v: Any) -> float:
+    """One observation value as float; '.' or anything non-numeric → NaN."""
+    if v == ".":
+        return np.nan
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _obs_values(values: list) -> np.ndarray:
+    """
+    Observation values as float64 with '.' → NaN, in one vectorized Arrow cast when pyarrow is
+    available; any other token Arrow can't parse sends the batch through `_obs_value`.
+    """
+    if _HAVE_PYARROW:
+        try:
+            arr = pa.array(values, type=pa.string())
+            arr = pc.if_else(pc.equal(arr, "."), pa.scalar(None, type=pa.string()), arr)
+            return pc.cast(arr, pa.float64()).to_numpy(zero_copy_only=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return np.fromiter((_obs_value(v) for v in values), dtype=np.float64, count=len(values))
+
+
+def _parse_iso_dates(dates: pd.Series) -> pd.Series:
+    """Parse ISO date strings via the module-level token cache (unique-then-map)."""
+    new = [d for d in pd.unique(dates) if d not in _ISO_DATE_CACHE]
+    if new:
+        _ISO_DATE_CACHE.update(zip(new, pd.to_datetime(new, format="%Y-%m-%d")))
+    return dates.map(_ISO_DATE_CACHE).astype("datetime64[ns]")
+
 
 def get_series(
     series_id: str,
@@ -23,6 +131,7 @@ def get_series(
     api_url: str = API_URL_DEFAULT,
     timeout: int = 30,
     extra_params: Optional[Dict[str, Any]] = None,
+    session: Optional[requests.Session] = None,
 ) -> pd.DataFrame:
     """
     Fetch a single FRED/ALFRED series' observations as a tidy DataFrame.
@@ -42,6 +151,8 @@ def get_series(
         HTTP timeout (seconds).
     extra_params : dict | None
         Optional extra query params (e.g., {"observation_start": "1990-01-01"}).
+    session : requests.Session | None
+        HTTP session to use; defaults to the module's shared keep-alive session.
 
     Returns
     -------
@@ -66,9 +177,9 @@ def get_series(
     if extra_params:
         params.update(extra_params)
 
-    r = requests.get(api_url, params=params, timeout=timeout)
+    r = (session or _SESSION).get(api_url, params=params, timeout=timeout)
     r.raise_for_status()
-    payload = r.json()
+    payload = orjson.loads(r.content) if _HAVE_ORJSON else r.json()
 
     obs = payload.get("observations", [])
     if not obs:
@@ -76,14 +187,39 @@ def get_series(
             f"No observations returned for series_id='{series_id}' (vintage={vintage})."
         )
 
-    df = pd.DataFrame(obs)[["date", "value"]]
-    # Convert "." to NaN, then to float; parse date
-    df["value"] = pd.to_numeric(df["value"].replace(".", None), errors="coerce")
-    df["date"] = pd.to_datetime(df["date"])
+    # Pull only the two needed fields; "." (FRED's missing marker) and junk become NaN
+    values = _obs_values([o["value"] for o in obs])
+    df = pd.DataFrame({"date": [o["date"] for o in obs], "value": values})
+    df["date"] = _parse_iso_dates(df["date"])  # FRED always returns ISO dates
     df = df.rename(columns={"date": "sasdate", "value": series_id}).sort_values("sasdate")
     return df
 
 
+def get_series_many(
+    series_ids: Iterable[str],
+    api_key: str,
+    *,
+    max_workers: int = 8,
+    **kwargs: Any,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch several series concurrently; returns {series_id: get_series(...) frame} in input order.
+
+    Requests are I/O-bound, so threads overlap the network round-trips; they share the pooled
+    session and a token bucket that keeps the batch under FRED_MAX_REQUESTS_PER_MINUTE.
+    `kwargs` are forwarded to get_series (vintage, timeout, extra_params, ...). The first
+    failing request re-raises its exception.
+    """
+    ids = list(series_ids)
+
+    def _fetch(sid: str) -> pd.DataFrame:
+        _RATE_LIMITER.acquire()
+        return get_series(sid, api_key, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ids) or 1))) as ex:
+        return dict(zip(ids, ex.map(_fetch, ids)))
+
+
 def to_named_column(df: pd.DataFrame, series_id: str, out_name: str) -> pd.DataFrame:
     """
     Rename the value column '<series_id>' to a friendlier name (e.g., 'gdp_qoq_saar').
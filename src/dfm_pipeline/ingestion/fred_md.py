@@ -1,19 +1,67 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Optional, Tuple
-
-import numpy as np
-import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple
+import csv
+import math
 
+from dfm_pipeline.utils.cached_config import dump_json
 from dfm_pipeline.utils.hashing import sha256_file
 from dfm_pipeline.validation.tcode_map import (
     validate_tcode_map_against_columns,
-    ALLOWED_TCODES,
+    is_allowed_tcode,
 )
 
 
+def _read_head(csv_path: str | Path, nrows: int) -> List[List[str]]:
+    """Return the first `nrows` raw CSV rows (header included) as lists of strings, one file open."""
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        return list(islice(csv.reader(f), nrows))
+
+
+def _parse_tcode_tokens(cols: Sequence[str], row: Sequence[str], date_col: str) -> Dict[str, Optional[int]]:
+    """
+    Map each non-date column to its token as an int code (None if empty/non-numeric).
+    Numeric tokens are truncated to int, as pandas' to_numeric(...).astype(int) does.
+    """
+    out: Dict[str, Optional[int]] = {}
+    for i, col in enumerate(cols):
+        if col == date_col:
+            continue
+        tok = row[i].strip() if i < len(row) else ""
+        try:
+            v = float(tok)
+        except ValueError:
+            out[col] = None
+            continue
+        out[col] = int(v) if math.isfinite(v) else None
+    return out
+
+
+def _is_tcode_token(tok: str) -> bool:
+    """True if `tok` reads as a number whose int truncation is in ALLOWED_TCODES."""
+    try:
+        v = float(tok)
+    except ValueError:
+        return False
+    return math.isfinite(v) and is_allowed_tcode(int(v))
+
+
+def _scan_tcode_row(head: Sequence[Sequence[str]], date_col: str) -> Optional[int]:
+    """First row after the header whose non-date entries are all codes in ALLOWED_TCODES."""
+    if not head:
+        return None
+    cols = head[0]
+    # Non-date positions resolved once; each row stops at its first non-code token
+    idx = [i for i, c in enumerate(cols) if c != date_col]
+    for i, row in enumerate(head[1:], start=1):
+        if all(j < len(row) and _is_tcode_token(row[j].strip()) for j in idx):
+            return i  # header row (0) + offset
+    return None
+
+
 def detect_tcode_row(
     csv_path: str | Path,
     *,
@@ -25,35 +73,31 @@ def detect_tcode_row(
 
     Heuristic: read the header to get column names, then scan the next few lines; the first line
     whose non-date entries are all integers in ALLOWED_TCODES is the t-code row.
+    Memoized per (resolved path, mtime_ns), so repeated calls on an unchanged file skip the scan.
 
     Returns
     -------
     row_idx : int | None
         0-based row index of the t-code row (header is row 0). None if not found.
     """
-    csv_path = Path(csv_path)
-    cols = pd.read_csv(csv_path, nrows=0).columns.tolist()
-
-    block = pd.read_csv(
-        csv_path,
-        header=None,       # treat scanned lines as data
-        names=cols,        # real header names
-        skiprows=1,        # skip header row
-        nrows=max_scan_rows,
-        dtype=str
-    )
+    p = Path(csv_path).resolve()
+    return _detect_tcode_row_cached(str(p), p.stat().st_mtime_ns, date_col, max_scan_rows)
 
-    for i, (_, row) in enumerate(block.iterrows()):
-        vals = row.drop(labels=[date_col], errors="ignore")
-        nums = pd.to_numeric(vals, errors="coerce")
-        if nums.notna().all():
-            try:
-                cand = set(nums.astype(int).tolist())
-            except Exception:
-                continue
-            if cand.issubset(ALLOWED_TCODES):
-                return 1 + i  # header row (0) + offset
-    return None
+
+@lru_cache(maxsize=8)
+def _detect_tcode_row_cached(
+    csv_path: str, mtime_ns: int, date_col: str, max_scan_rows: int
+) -> Optional[int]:
+    """Uncached scan behind detect_tcode_row; `mtime_ns` only participates in the cache key."""
+    return _scan_tcode_row(_read_head(csv_path, max_scan_rows + 1), date_col)
+
+
+def _tcode_map_from_row(cols: Sequence[str], row: Sequence[str], date_col: str) -> Dict[str, int]:
+    """{series: code} for the entries of one t-code row that are codes in ALLOWED_TCODES."""
+    return {
+        k: v for k, v in _parse_tcode_tokens(cols, row, date_col).items()
+        if v is not None and is_allowed_tcode(v)
+    }
 
 
 def read_embedded_tcode_map(
@@ -76,18 +120,10 @@ def read_embedded_tcode_map(
     tcode_map : dict[str, int]
         Mapping for present series; codes restricted to ALLOWED_TCODES.
     """
-    csv_path = Path(csv_path)
-    cols = pd.read_csv(csv_path, nrows=0).columns.tolist()
-    row = pd.read_csv(
-        csv_path,
-        header=None,
-        names=cols,
-        skiprows=tcode_row,
-        nrows=1,
-        dtype=str
-    ).iloc[0]
-    series = pd.to_numeric(row.drop(labels=[date_col], errors="ignore"), errors="coerce")
-    return {k: int(v) for k, v in series.dropna().items() if int(v) in ALLOWED_TCODES}
+    head = _read_head(csv_path, tcode_row + 1)
+    if len(head) <= tcode_row:
+        raise ValueError(f"{csv_path}: t-code row {tcode_row} is past the end of the file.")
+    return _tcode_map_from_row(head[0], head[tcode_row], date_col)
 
 
 def extract_tcodes_to_json(
@@ -141,8 +177,10 @@ def extract_tcodes_to_json(
     csv_path = Path(csv_path)
     out_json_path = Path(out_json_path)
 
-    # Header columns (no need to read data rows)
-    header_cols = pd.read_csv(csv_path, nrows=0).columns.tolist()
+    # One read of the leading rows serves header, detection and extraction
+    scan_rows = 5
+    head = _read_head(csv_path, max(scan_rows, tcode_row or 0) + 1)
+    header_cols = head[0] if head else []
     if date_col not in header_cols:
         raise ValueError(
             f"Expected date column '{date_col}' in CSV header; found: {header_cols[:6]}..."
@@ -150,12 +188,14 @@ def extract_tcodes_to_json(
 
     # Find the t-code row
     if tcode_row is None:
-        tcode_row = detect_tcode_row(csv_path, date_col=date_col) if autodetect_tcode_row else None
+        tcode_row = _scan_tcode_row(head, date_col) if autodetect_tcode_row else None
         if tcode_row is None:
             tcode_row = 1  # conventional default: header at row 0, tcodes at row 1
 
     # Build mapping from embedded row
-    raw_map = read_embedded_tcode_map(csv_path, date_col=date_col, tcode_row=tcode_row)
+    if tcode_row >= len(head):
+        raise ValueError(f"{csv_path}: t-code row {tcode_row} is past the end of the file.")
+    raw_map = _tcode_map_from_row(header_cols, head[tcode_row], date_col)
 
     # Validate/clean against header
     tcode_map, check = validate_tcode_map_against_columns(
@@ -171,8 +211,7 @@ def extract_tcodes_to_json(
 
     # Write mapping JSON
     out_json_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_json_path.open("w", encoding="utf-8") as f:
-        json.dump(tcode_map, f, indent=2, sort_keys=True)
+    dump_json(tcode_map, out_json_path, sort_keys=True)
 
     # Provenance / diagnostics
     info = {
@@ -187,8 +226,7 @@ def extract_tcodes_to_json(
 
     if write_sidecar_metadata:
         meta_path = out_json_path.with_suffix(out_json_path.suffix + ".meta.json")
-        with meta_path.open("w", encoding="utf-8") as f:
-            json.dump(info, f, indent=2, sort_keys=True)
+        dump_json(info, meta_path, sort_keys=True)
         info["metadata_json_path"] = str(meta_path)
 
     return tcode_map, info
@@ -0,0 +1,127 @@
+# src/dfm_pipeline/metadata/maps.py
+"""
+Hand-curated FRED-MD series maps, kept as in-memory constants.
+
+Importing these avoids a JSON round-trip; scripts/generate_*_map.py only export them to
+data/metadata/*.json. Note that build_transformed_panel still reads tcode_map.json, which is
+extracted from the vintage's embedded t-code row and is authoritative for that file.
+"""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Mapping, TypeVar
+
+_V = TypeVar("_V")
+
+__all__ = ["VARIABLE_GROUP_MAP", "TCODE_MAP"]
+
+# (group label, series) — each series must appear exactly once (checked at import)
+_GROUP_KEYS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Output & Income", (
+        'RPI', 'W875RX1', 'DPCERA3M086SBEA', 'CMRMTSPLx', 'RETAILx', 'INDPRO',
+        'IPFPNSS', 'IPFINAL', 'IPCONGD', 'IPDCONGD', 'IPNCONGD', 'IPBUSEQ',
+        'IPMAT', 'IPDMAT', 'IPNMAT', 'IPMANSICS', 'IPB51222S', 'IPFUELS',
+        'CUMFNS'
+    )),
+    ("Labor Market", (
+        'HWI', 'HWIURATIO', 'CLF16OV', 'CE16OV', 'UNRATE', 'UEMPMEAN',
+        'UEMPLT5', 'UEMP5TO14', 'UEMP15OV', 'UEMP15T26', 'UEMP27OV',
+        'CLAIMSx', 'PAYEMS', 'USGOOD', 'CES1021000001', 'USCONS', 'MANEMP',
+        'DMANEMP', 'NDMANEMP', 'SRVPRD', 'USTPU', 'USWTRADE', 'USTRADE',
+        'USFIRE', 'USGOVT', 'CES0600000007', 'AWOTMAN', 'AWHMAN'
+    )),
+    ("Housing", (
+        'HOUST', 'HOUSTNE', 'HOUSTMW', 'HOUSTS', 'HOUSTW',
+        'PERMIT', 'PERMITNE', 'PERMITMW', 'PERMITS', 'PERMITW'
+    )),
+    ("Orders & Inventories", (
+        'ACOGNO', 'AMDMNOx', 'ANDENOx', 'AMDMUOx', 'BUSINVx', 'ISRATIOx'
+    )),
+    ("Money & Credit", (
+        'M1SL', 'M2SL', 'M2REAL', 'BOGMBASE', 'TOTRESNS', 'NONBORRES',
+        'BUSLOANS', 'REALLN', 'NONREVSL', 'CONSPI'
+    )),
+    ("Stock Market", (
+        'S&P 500', 'S&P div yield', 'S&P PE ratio'
+    )),
+    ("Interest & Exchange Rates", (
+        'FEDFUNDS', 'CP3Mx', 'TB3MS', 'TB6MS', 'GS1', 'GS5', 'GS10',
+        'AAA', 'BAA', 'COMPAPFFx', 'TB3SMFFM', 'TB6SMFFM', 'T1YFFM',
+        'T5YFFM', 'T10YFFM', 'AAAFFM', 'BAAFFM'
+    )),
+    ("Exchange Rates", (
+        'TWEXAFEGSMTHx', 'EXSZUSx', 'EXJPUSx', 'EXUSUKx', 'EXCAUSx'
+    )),
+    ("Prices", (
+        'WPSFD49207', 'WPSFD49502', 'WPSID61', 'WPSID62', 'OILPRICEx',
+        'PPICMM', 'CPIAUCSL', 'CPIAPPSL', 'CPITRNSL', 'CPIMEDSL',
+        'CUSR0000SAC', 'CUSR0000SAD', 'CUSR0000SAS', 'CPIULFSL',
+        'CUSR0000SA0L2', 'CUSR0000SA0L5', 'PCEPI'
+    )),
+    ("Consumption & Investment", (
+        'DDURRG3M086SBEA', 'DNDGRG3M086SBEA', 'DSERRG3M086SBEA',
+        'CES0600000008', 'CES2000000008', 'CES3000000008'
+    )),
+    ("Expectations", (
+        'UMCSENTx', 'DTCOLNVHFNM', 'DTCTHFNM', 'INVEST', 'VIXCLSx'
+    )),
+)
+
+# (t-code, series)
+_TCODE_KEYS: tuple[tuple[int, tuple[str, ...]], ...] = (
+    (1, (
+        'CES0600000007', 'COMPAPFFx', 'TB3SMFFM', 'TB6SMFFM', 'T1YFFM',
+        'T5YFFM', 'T10YFFM', 'AAAFFM', 'BAAFFM', 'VIXCLSx', 'AWHMAN'
+    )),
+    (2, (
+        'CUMFNS', 'HWI', 'HWIURATIO', 'UNRATE', 'UEMPMEAN', 'CONSPI',
+        'S&P div yield', 'FEDFUNDS', 'CP3Mx', 'TB3MS', 'TB6MS', 'GS1',
+        'GS5', 'GS10', 'AAA', 'BAA', 'UMCSENTx', 'AWOTMAN', 'ISRATIOx'
+    )),
+    (3, ()),  # Explicit empty group
+    (4, (
+        'HOUST', 'HOUSTNE', 'HOUSTMW', 'HOUSTS', 'HOUSTW',
+        'PERMIT', 'PERMITNE', 'PERMITMW', 'PERMITS', 'PERMITW'
+    )),
+    (5, (
+        'RPI', 'W875RX1', 'DPCERA3M086SBEA', 'CMRMTSPLx', 'RETAILx',
+        'INDPRO', 'IPFPNSS', 'IPFINAL', 'IPCONGD', 'IPDCONGD', 'IPNCONGD',
+        'IPBUSEQ', 'IPMAT', 'IPDMAT', 'IPNMAT', 'IPMANSICS', 'IPB51222S',
+        'IPFUELS', 'CLF16OV', 'CE16OV', 'UEMPLT5', 'UEMP5TO14', 'UEMP15OV',
+        'UEMP15T26', 'UEMP27OV', 'CLAIMSx', 'PAYEMS', 'USGOOD',
+        'CES1021000001', 'USCONS', 'MANEMP', 'DMANEMP', 'NDMANEMP', 'SRVPRD',
+        'USTPU', 'USWTRADE', 'USTRADE', 'USFIRE', 'USGOVT', 'ACOGNO',
+        'AMDMNOx', 'ANDENOx', 'AMDMUOx', 'BUSINVx', 'M2REAL', 'S&P 500',
+        'S&P PE ratio', 'TWEXAFEGSMTHx', 'EXSZUSx', 'EXJPUSx', 'EXUSUKx',
+        'EXCAUSx'
+    )),
+    (6, (
+        'M1SL', 'M2SL', 'BOGMBASE', 'TOTRESNS', 'BUSLOANS', 'REALLN',
+        'NONREVSL', 'WPSFD49207', 'WPSFD49502', 'WPSID61', 'WPSID62',
+        'OILPRICEx', 'PPICMM', 'CPIAUCSL', 'CPIAPPSL', 'CPITRNSL',
+        'CPIMEDSL', 'CUSR0000SAC', 'CUSR0000SAD', 'CUSR0000SAS',
+        'CPIULFSL', 'CUSR0000SA0L2', 'CUSR0000SA0L5', 'PCEPI',
+        'DDURRG3M086SBEA', 'DNDGRG3M086SBEA', 'DSERRG3M086SBEA',
+        'CES0600000008', 'CES2000000008', 'CES3000000008', 'DTCOLNVHFNM',
+        'DTCTHFNM', 'INVEST'
+    )),
+    (7, (
+        'NONBORRES',
+    )),
+)
+
+
+
+def _invert(blocks: tuple[tuple[_V, tuple[str, ...]], ...], name: str) -> Mapping[str, _V]:
+    """Flatten (value, series) blocks into a read-only series -> value map; reject repeats."""
+    out: dict[str, _V] = {}
+    for value, keys in blocks:
+        for k in keys:
+            if k in out:
+                raise ValueError(f"{name}: series {k!r} listed twice ({out[k]!r} and {value!r}).")
+            out[k] = value
+    return MappingProxyType(out)
+
+
+VARIABLE_GROUP_MAP: Mapping[str, str] = _invert(_GROUP_KEYS, "VARIABLE_GROUP_MAP")
+TCODE_MAP: Mapping[str, int] = _invert(_TCODE_KEYS, "TCODE_MAP")
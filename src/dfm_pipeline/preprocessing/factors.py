@@ -1,21 +1,31 @@
 from __future__ import annotations
 
 from typing import Dict, Literal, Optional, Tuple
+import logging
 import numpy as np
 import pandas as pd
 
-from .tcode import apply_tcode_transformations, LEADS_LOST
+from .tcode import _tcode_buffer, LEADS_LOST
 
-__all__ = ["prepare_panel_for_factors", "standardize"]
+__all__ = ["prepare_panel_for_factors", "standardize", "panel_array", "TRANSFORMED_DTYPE"]
 
+# Working precision of the dense (T × N) block handed to factor estimation (covariance/PCA):
+# z-scored FRED-MD series are O(1), so float32's ~7 significant digits are ample, and the
+# block is half the bytes of the float64 panel.
+TRANSFORMED_DTYPE = np.float32
 
-def _first_valid_iloc(s: pd.Series) -> Optional[int]:
+
+def _first_valid_ilocs(arr: np.ndarray, columns: pd.Index) -> Dict[str, Optional[int]]:
     """
-    Position (iloc) of first non-NaN, or None if all NaN.
+    Position (iloc) of the first non-NaN per column of `arr`, or None for all-NaN columns.
+    One NumPy pass over the whole block instead of one call per column.
     """
-    a = s.to_numpy()
-    mask = ~np.isnan(a)
-    return int(mask.argmax()) if mask.any() else None
+    mask = ~np.isnan(arr)
+    if mask.shape[0] == 0:
+        return dict.fromkeys(columns)
+    first = mask.argmax(axis=0)
+    any_valid = mask.any(axis=0)
+    return {col: int(loc) if ok else None for col, loc, ok in zip(columns, first, any_valid)}
 
 
 def _zscore(
@@ -27,11 +37,34 @@ def _zscore(
     """
     mu = df.mean(skipna=True)
     sigma = df.std(ddof=ddof, skipna=True)
-    sigma = sigma.replace({0.0: np.nan})
-    z = (df - mu) / sigma
+    sigma[sigma.to_numpy() == 0.0] = np.nan
+    # One owned float64 buffer, centred and scaled in place (no pandas temporaries)
+    arr = df.to_numpy(dtype=np.float64, copy=True)
+    arr -= mu.to_numpy()
+    arr /= sigma.to_numpy()
+    z = pd.DataFrame(arr, index=df.index, columns=df.columns, copy=False)
     return z, mu, sigma
 
 
+def _zscore_inplace(
+    arr: np.ndarray,
+    index: pd.Index,
+    columns: pd.Index,
+    ddof: int = 0,
+) -> Tuple[pd.Series, pd.Series]:
+    """
+    `_zscore` on a caller-owned float64 buffer: overwrite `arr` with (x - mean) / std and
+    return (means, stds). Moments come from pandas on a no-copy view, so they match `_zscore`.
+    """
+    view = pd.DataFrame(arr, index=index, columns=columns, copy=False)
+    mu = view.mean(skipna=True)
+    sigma = view.std(ddof=ddof, skipna=True)
+    sigma[sigma.to_numpy() == 0.0] = np.nan
+    arr -= mu.to_numpy()
+    arr /= sigma.to_numpy()
+    return mu, sigma
+
+
 def standardize(df: pd.DataFrame, ddof: int = 0) -> pd.DataFrame:
     """
     Convenience wrapper for z-scoring (mean 0, variance 1 by column).
@@ -40,6 +73,26 @@ def standardize(df: pd.DataFrame, ddof: int = 0) -> pd.DataFrame:
     return z
 
 
+def panel_array(
+    df: pd.DataFrame,
+    dtype: np.dtype | type = TRANSFORMED_DTYPE,
+    *,
+    safe: bool = False,
+) -> np.ndarray:
+    """
+    The panel as one C-contiguous (T × N) array in `dtype` (rows = df.index, cols = df.columns).
+
+    With safe=True, also log (INFO) the max absolute rounding error against the float64 values.
+    """
+    arr = np.ascontiguousarray(df.to_numpy(dtype=dtype))
+    if safe:
+        src = df.to_numpy(dtype=np.float64)
+        diff = np.abs(arr.astype(np.float64) - src)
+        err = float(np.nanmax(diff)) if np.isfinite(diff).any() else 0.0
+        logging.info(f"Panel as {np.dtype(dtype).name}: max abs rounding error vs float64 = {err:.3g}")
+    return arr
+
+
 def prepare_panel_for_factors(
     df_raw: pd.DataFrame,
     tcode_map: Dict[str, int],
@@ -47,6 +100,7 @@ def prepare_panel_for_factors(
     balance: Literal["none", "initial", "all"] = "initial",
     standardize: bool = True,
     ddof: int = 0,
+    array_dtype: Optional[np.dtype | type] = None,
 ) -> Tuple[pd.DataFrame, Dict]:
     """
     Full preprocessing pipeline for factor models:
@@ -69,6 +123,9 @@ def prepare_panel_for_factors(
         If True, z-score columns after balancing.
     ddof : int
         Degrees of freedom for std (0 recommended for population-style scaling).
+    array_dtype : dtype | None
+        If given (e.g. TRANSFORMED_DTYPE), also return the final block as one C-contiguous
+        array of that dtype in info["array"], aligned with df_out's index and columns.
 
     Returns
     -------
@@ -82,43 +139,43 @@ def prepare_panel_for_factors(
     - Tcode transforms do NOT guarantee stationarity—inspect as needed.
     - For PCA, use balance="initial" or "all". For EM/Kalman DFMs, balance="none" is fine.
     """
-    # 1) Transform
-    df_t = apply_tcode_transformations(df_raw, tcode_map)
+    if balance not in ("none", "initial", "all"):
+        raise ValueError("balance must be one of {'none','initial','all'}")
+
+    # 1) Transform into one owned float64 buffer; later steps slice it and work in place,
+    #    and a DataFrame is only built around the final block
+    arr, index, columns = _tcode_buffer(df_raw, tcode_map)
 
     # 2) Balance
-    first_locs = {col: _first_valid_iloc(df_t[col]) for col in df_t.columns}
+    first_locs = _first_valid_ilocs(arr, columns)
     all_nan_cols = [c for c, loc in first_locs.items() if loc is None]
     if all_nan_cols:
-        df_t = df_t.drop(columns=all_nan_cols)
-
-    # Recompute after any drops
-    first_locs = {col: _first_valid_iloc(df_t[col]) for col in df_t.columns}
-    valid_locs = [loc for loc in first_locs.values() if loc is not None]
-    global_first = max(valid_locs) if valid_locs else 0
+        keep = np.array([loc is not None for loc in first_locs.values()])
+        arr, columns = arr[:, keep], columns[keep]
+        # Dropping columns does not move the others' first-valid rows: filter, don't recompute
+        first_locs = {c: loc for c, loc in first_locs.items() if loc is not None}
+    global_first = max(first_locs.values()) if first_locs else 0
 
     if balance == "none":
-        df_b = df_t
         rows_dropped = []
-    elif balance == "initial":
-        df_b = df_t.iloc[global_first:].copy()
-        rows_dropped = list(df_t.index[:global_first])
-    elif balance == "all":
-        df_b = df_t.iloc[global_first:].dropna(axis=0, how="any").copy()
-        initially_dropped = list(df_t.index[:global_first])
-        additionally_dropped = list(
-            sorted(set(df_t.index[global_first:]).difference(set(df_b.index)))
-        )
-        rows_dropped = initially_dropped + additionally_dropped
     else:
-        raise ValueError("balance must be one of {'none','initial','all'}")
-
-    # 3) Standardize
+        rows_dropped = list(index[:global_first])
+        arr, index = arr[global_first:], index[global_first:]  # view, no copy
+        if balance == "all":
+            complete = ~np.isnan(arr).any(axis=1)
+            rows_dropped += list(index[~complete])
+            # One gather into a column-major buffer (the layout pandas' dropna produces),
+            # so the moments below are summed in the same order as on a DataFrame
+            rows = np.flatnonzero(complete)
+            arr = np.take(arr, rows, axis=0, out=np.empty((rows.size, arr.shape[1]), order="F"))
+            index = index[rows]
+
+    # 3) Standardize (in place on the balanced block)
     if standardize:
-        df_z, mu, sigma = _zscore(df_b, ddof=ddof)
-        df_out = df_z
+        mu, sigma = _zscore_inplace(arr, index, columns, ddof=ddof)
     else:
-        df_out = df_b
         mu, sigma = None, None
+    df_out = pd.DataFrame(arr, index=index, columns=columns, copy=False)
 
     info = {
         "all_nan_columns_dropped": all_nan_cols,
@@ -130,4 +187,6 @@ def prepare_panel_for_factors(
         "stds": sigma,
         "leads_lost_by_tcode": LEADS_LOST,
     }
+    if array_dtype is not None:
+        info["array"] = panel_array(df_out, array_dtype)
     return df_out, info
@@ -1,11 +1,17 @@
 # src/dfm_pipeline/preprocessing/panel_variants.py
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-import json
 from typing import Dict, List, Tuple
+import shutil
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from dfm_pipeline.utils.cached_config import dump_json
+from dfm_pipeline.utils.jit import numba_kernel
 
 
 # ---------- Defaults (tune here or override via function args) ----------
@@ -36,36 +42,122 @@ def ensure_monthly_panel(
     """
     Load a CSV, parse the date column (mm/dd/yyyy), and reindex to a contiguous monthly index (Month Start).
     Returns a DataFrame with a DatetimeIndex of monthly stamps and original columns.
+
+    Memoized per (resolved path, mtime_ns, size, date_col, date_fmt): rewriting the file
+    invalidates the entry. Each call gets its own deep copy (the parse and reindex are what
+    the cache saves), so callers may modify the result freely.
     """
-    df = pd.read_csv(in_csv)
+    p = Path(in_csv).resolve()
+    st = p.stat()
+    cached = _ensure_monthly_panel_cached(str(p), st.st_mtime_ns, st.st_size, date_col, date_fmt)
+    return cached.copy()
+
+
+@lru_cache(maxsize=8)
+def _ensure_monthly_panel_cached(
+    in_csv: str, mtime_ns: int, size: int, date_col: str, date_fmt: str
+) -> pd.DataFrame:
+    """Uncached load behind ensure_monthly_panel; `mtime_ns`/`size` only participate in the cache key."""
+    from dfm_pipeline.utils.io import read_csv_fast
+
+    # Arrow CSV reader when available; dates parsed with date_fmt during the read (bad → NaT)
+    df = read_csv_fast(in_csv, date_col=date_col, date_fmt=date_fmt)
     if date_col not in df.columns:
         raise ValueError(f"Date column '{date_col}' not found in {in_csv}")
-    df[date_col] = pd.to_datetime(df[date_col], format=date_fmt, errors="coerce")
     if df[date_col].isna().all():
         raise ValueError(f"Could not parse any dates in column '{date_col}' using format '{date_fmt}'.")
     df = df.set_index(date_col).sort_index()
 
     # Build a contiguous monthly index so “months” are counted correctly
     full_idx = pd.date_range(df.index.min(), df.index.max(), freq="MS")
-    df = df.reindex(full_idx)
+    if len(full_idx) == len(df) and (df.index.values == full_idx.values).all():
+        df.index = full_idx  # already contiguous month-starts: swap the index, skip the copy
+    else:
+        df = df.reindex(full_idx)
     df.index.name = date_col  # ensure a named index for clean CSVs
 
     return df
 
 
+@numba_kernel
+def _gap_stats_kernel(numba):
+    """Numba-compiled per-column gap scan: one pass per column, no temporaries."""
+
+    @numba.njit(cache=True)
+    def kernel(valid):
+        T, N = valid.shape
+        lead = np.empty(N, dtype=np.int64)
+        interior = np.empty(N, dtype=np.int64)
+        for j in range(N):
+            first = -1
+            for i in range(T):
+                if valid[i, j]:
+                    first = i
+                    break
+            if first < 0:
+                lead[j] = T
+                interior[j] = T
+                continue
+            last = first
+            for i in range(T - 1, first, -1):
+                if valid[i, j]:
+                    last = i
+                    break
+            lead[j] = first
+            best = 0
+            run = 0
+            for i in range(first + 1, last):
+                if valid[i, j]:
+                    run = 0
+                else:
+                    run += 1
+                    if run > best:
+                        best = run
+            interior[j] = best
+        return lead, interior
+
+    return kernel
+
+
+def _column_gap_stats(valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-column (leading NaN count, longest interior NaN run) for a (T × N) validity mask.
+    All-NaN columns get T for both. Uses the Numba kernel when available, else a
+    vectorized NumPy pass.
+    """
+    T, N = valid.shape
+    if T == 0:
+        return np.zeros(N, dtype=np.int64), np.zeros(N, dtype=np.int64)
+    kernel = _gap_stats_kernel()
+    if kernel is not None:
+        return kernel(np.asfortranarray(valid))
+    return _column_gap_stats_numpy(valid)
+
+
+def _column_gap_stats_numpy(valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized NumPy version of `_column_gap_stats` (T ≥ 1); fallback when numba is absent."""
+    T = valid.shape[0]
+    any_valid = valid.any(axis=0)
+    rows = np.arange(T)[:, None]
+    lead = np.where(any_valid, valid.argmax(axis=0), T)
+    last = T - 1 - valid[::-1].argmax(axis=0)
+    # Row of the latest observation at or before each row; a NaN at row t ends a run of
+    # length t - prev. Only NaNs between the first and last observation count as interior.
+    prev = np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+    run = np.where(~valid & (prev >= 0) & (rows < last), rows - prev, 0)
+    interior = np.where(any_valid, run.max(axis=0), T)
+    return lead, interior
+
+
 def leading_na_since(s: pd.Series, start_ts: pd.Timestamp) -> int:
     """Count initial NaN months from start_ts onward until the first non-NaN."""
-    s2 = s.loc[start_ts:]
-    return int(s2.isna().cumprod().sum())
+    valid = s.loc[start_ts:].notna().to_numpy()
+    return int(_column_gap_stats(valid[:, None])[0][0])
 
 
 def interior_max_gap(s: pd.Series) -> int:
     """Longest contiguous NaN run between first and last valid obs (after anchoring)."""
-    if s.notna().sum() == 0:
-        return len(s)
-    a = s.loc[s.first_valid_index(): s.last_valid_index()]
-    runs = (a.isna() != a.isna().shift()).cumsum()
-    return int(a.isna().groupby(runs).sum().max())
+    return int(_column_gap_stats(s.notna().to_numpy()[:, None])[1][0])
 
 
 def pick_training_window(
@@ -95,19 +187,21 @@ def pick_training_window(
     # Work with an explicit DatetimeIndex for clearer typing
     idx: pd.DatetimeIndex = pd.DatetimeIndex(anchored.index)
 
-    coverage = anchored.notna().mean(axis=1)  # 0..1 per month
+    coverage = anchored.notna().to_numpy().mean(axis=1)  # 0..1 per month
 
-    roll_ok = coverage.rolling(min_run, min_periods=min_run).min() >= cov_thresh
-    if bool(roll_ok.any()):
-        first_ok: pd.Timestamp = pd.Timestamp(roll_ok[roll_ok].index[0])
+    # Trailing min over min_run months: a window ending at row k + min_run - 1 qualifies
+    ok = coverage >= cov_thresh
+    roll_ok = (
+        np.flatnonzero(sliding_window_view(coverage, min_run).min(axis=1) >= cov_thresh)
+        if 0 < min_run <= len(coverage) else np.empty(0, dtype=np.intp)
+    )
+    if roll_ok.size:
+        start_min_idx = int(roll_ok[0]) + min_run - 1
+    elif ok.any():
+        start_min_idx = int(ok.argmax())
     else:
-        ok = coverage >= cov_thresh
-        if bool(ok.any()):
-            first_ok = pd.Timestamp(ok[ok].index[0])
-        else:
-            # fallback: the min_run-th month (0-based) if available, else the last available
-            fallback_pos = min(min_run - 1, max(0, len(idx) - 1))
-            first_ok = pd.Timestamp(idx[fallback_pos])
+        # fallback: the min_run-th month (0-based) if available, else the last available
+        start_min_idx = min(min_run - 1, max(0, len(idx) - 1))
 
     # End: leave a holdout buffer
     n = len(idx)
@@ -116,7 +210,6 @@ def pick_training_window(
 
     # Start: aim for train_years*12 months ending at train_end, but not before first_ok
     desired_len = train_years * 12
-    start_min_idx = int(idx.get_indexer([first_ok], method="nearest")[0])
     start_idx = max(start_min_idx, end_idx - desired_len + 1)
     train_start: pd.Timestamp = pd.Timestamp(idx[start_idx])
 
@@ -149,6 +242,7 @@ def build_variant(
     holdout_months: int = HOLDOUT_MONTHS_DEFAULT,
     min_run_consec: int = MIN_RUN_CONSEC_DEFAULT,
     in_csv_path: Path | None = None,
+    start_pos: int | None = None,
 ) -> Dict:
     """
     Build one variant:
@@ -157,13 +251,18 @@ def build_variant(
       3) Apply 4 column rules and drop violating series.
       4) Save CSVs (index-labeled and sasdate-as-column) + a JSON catalog of decisions.
 
+    `start_pos` is the iloc of anchor_start in df_all's (sorted) index; pass it when building
+    several variants from one panel to slice positionally instead of re-scanning the dates.
+
     Returns a dict with metadata (also written to JSON).
     """
     out_dir_processed.mkdir(parents=True, exist_ok=True)
     out_dir_meta.mkdir(parents=True, exist_ok=True)
 
     anchor_ts = pd.to_datetime(anchor_start, format=date_fmt)
-    df = df_all.loc[df_all.index >= anchor_ts].copy()
+    if start_pos is None:
+        start_pos = int(df_all.index.searchsorted(anchor_ts))
+    df = df_all.iloc[start_pos:].copy()
 
     train_start, train_end = pick_training_window(
         df,
@@ -173,35 +272,40 @@ def build_variant(
         min_run=min_run_consec,
     )
 
+    # Column rules, evaluated for all series at once on the validity mask
+    valid = df.notna().to_numpy()
+    miss_share = (~valid).mean(axis=0)
+    lead_na, interior = _column_gap_stats(valid[df.index.searchsorted(anchor_ts):])
+    lo = df.index.searchsorted(train_start, side="left")
+    hi = df.index.searchsorted(train_end, side="right")
+    nobs_train = valid[lo:hi].sum(axis=0)
+
+    reasons = np.select(
+        [
+            miss_share > miss_share_max,
+            lead_na > lead_limit_months,
+            interior > interior_gap_max_months,
+            nobs_train < min_obs_train_months,
+        ],
+        [
+            f"missing_share>{miss_share_max:.2f}",
+            f"leading_na>{lead_limit_months}",
+            f"interior_gap>{interior_gap_max_months}",
+            f"nobs_train<{min_obs_train_months}",
+        ],
+        default="",
+    )
+
     drop: Dict[str, Dict] = {}
     kept: List[str] = []
-
-    for col in df.columns:
-        s = df[col]
-        st = s.loc[train_start:train_end]
-
-        miss_share = float(s.isna().mean())
-        lead_na = leading_na_since(s, anchor_ts)
-        interior = interior_max_gap(s)
-        nobs_train = int(st.notna().sum())
-
-        why = None
-        if miss_share > miss_share_max:
-            why = f"missing_share>{miss_share_max:.2f}"
-        elif lead_na > lead_limit_months:
-            why = f"leading_na>{lead_limit_months}"
-        elif interior > interior_gap_max_months:
-            why = f"interior_gap>{interior_gap_max_months}"
-        elif nobs_train < min_obs_train_months:
-            why = f"nobs_train<{min_obs_train_months}"
-
-        if why:
+    for j, col in enumerate(df.columns):
+        if reasons[j]:
             drop[col] = {
-                "missing_share": miss_share,
-                "leading_na_since_anchor": lead_na,
-                "interior_gap_months": interior,
-                "nobs_train": nobs_train,
-                "drop_reason": why,
+                "missing_share": float(miss_share[j]),
+                "leading_na_since_anchor": int(lead_na[j]),
+                "interior_gap_months": int(interior[j]),
+                "nobs_train": int(nobs_train[j]),
+                "drop_reason": str(reasons[j]),
             }
         else:
             kept.append(col)
@@ -209,15 +313,16 @@ def build_variant(
     df_out = df[kept]
 
     # ---------- Write BOTH CSV styles ----------
-    # A) Keep DatetimeIndex (label it 'sasdate' to avoid <anonymous>)
-    df_out.index.name = DATE_COL_DEFAULT
+    # A) Keep DatetimeIndex (label it 'sasdate' to avoid <anonymous>).
+    # Classic %.10g text (same bytes as to_csv); DFM_ARROW_CSV=1 opts into pyarrow's writer.
+    from dfm_pipeline.utils.io import save_panel_csv
+
     out_csv_index = out_dir_processed / f"{name}.csv"
-    df_out.to_csv(out_csv_index, index_label=DATE_COL_DEFAULT, date_format=date_fmt, float_format="%.10g")
+    save_panel_csv(df_out, out_csv_index, date_fmt=date_fmt, index_label=DATE_COL_DEFAULT)
 
-    # B) sasdate as a regular column (no index)
-    df_out_reset = df_out.reset_index().rename(columns={df_out.index.name or "index": DATE_COL_DEFAULT})
+    # B) sasdate as a regular column (no index): the same bytes, so copy instead of re-serializing
     out_csv_col = out_dir_processed / f"{name}_sasdate_column.csv"
-    df_out_reset.to_csv(out_csv_col, index=False, date_format=date_fmt, float_format="%.10g")
+    shutil.copyfile(out_csv_index, out_csv_col)
 
     # ---------- Metadata ----------
     ts_to_str = lambda ts: pd.Timestamp(ts).strftime(date_fmt)
@@ -253,7 +358,7 @@ def build_variant(
         },
     }
 
-    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    dump_json(meta, meta_path)
 
     return meta
 
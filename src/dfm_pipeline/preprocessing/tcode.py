@@ -1,9 +1,13 @@
 # src/dfm_pipeline/preprocessing/tcode.py  (or wherever you keep it)
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 import numpy as np
 import pandas as pd
 
-__all__ = ["apply_tcode_transformations", "standardize", "ALLOWED_TCODES", "LEADS_LOST"]
+from dfm_pipeline.utils.jit import numba_kernel
+from dfm_pipeline.validation.tcode_map import allowed_tcode_mask
+
+__all__ = ["apply_tcode_transformations", "apply_tcode_transformations_into", "standardize", "ALLOWED_TCODES", "LEADS_LOST"]
 
 # Stock–Watson / FRED-MD t-codes
 ALLOWED_TCODES: set[int] = {1, 2, 3, 4, 5, 6, 7}
@@ -11,38 +15,204 @@ ALLOWED_TCODES: set[int] = {1, 2, 3, 4, 5, 6, 7}
 LEADS_LOST: Dict[int, int] = {1: 0, 2: 1, 3: 2, 4: 0, 5: 1, 6: 2, 7: 2}
 
 
+def _safe_log(s: pd.Series) -> pd.Series:
+    """Domain-safe log: non-positive entries map to NaN."""
+    return np.log(s.where(s > 0))
+
+
+# t-code -> Series transform; one dict lookup instead of an if/elif ladder per column
+_SERIES_TRANSFORMS = {
+    1: lambda s: s,                               # level
+    2: lambda s: s.diff(),                        # Δx
+    3: lambda s: s.diff().diff(),                 # Δ²x
+    4: _safe_log,                                 # log x
+    5: lambda s: _safe_log(s).diff(),             # Δ log x
+    6: lambda s: _safe_log(s).diff().diff(),      # Δ² log x
+    7: lambda s: s.pct_change().diff(),           # Δ growth
+}
+
+
 def _transform_series(x: pd.Series, code: int) -> pd.Series:
     """
     Robust single-series transform (assumes time index ascending).
       1: level; 2: Δx; 3: Δ²x; 4: log x; 5: Δ log x; 6: Δ² log x; 7: Δ(x_t/x_{t-1} − 1)
     """
-    s = pd.to_numeric(x, errors="coerce").astype(float)  # coerce messy tokens → NaN
+    fn = _SERIES_TRANSFORMS.get(code)
+    if fn is None:
+        raise ValueError(f"Unknown tcode: {code}. Allowed: {sorted(ALLOWED_TCODES)}")
+
+    # float64 input (the usual case after a CSV read) needs no coercion pass
+    if x.dtype == np.float64:
+        s = x
+    else:
+        s = pd.to_numeric(x, errors="coerce").astype(float)  # coerce messy tokens → NaN
+
+    # Clean up numeric artifacts
+    return fn(s).replace([np.inf, -np.inf], np.nan)
+
+
+def _diff(a: np.ndarray) -> np.ndarray:
+    """First difference along time (axis 0); NaN in the first row (like DataFrame.diff)."""
+    out = np.empty_like(a)
+    out[:1] = np.nan
+    np.subtract(a[1:], a[:-1], out=out[1:])
+    return out
+
 
+def _log_pos(a: np.ndarray) -> np.ndarray:
+    """Domain-safe log: non-positive (and NaN) entries map to NaN."""
+    return np.log(np.where(a > 0, a, np.nan))
+
+
+def _ffill(a: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs along time (axis 0); leading NaNs stay NaN."""
+    steps = np.arange(a.shape[0]).reshape((-1,) + (1,) * (a.ndim - 1))
+    idx = np.where(np.isnan(a), 0, steps)
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    return np.take_along_axis(a, idx, axis=0)
+
+
+def _transform_array(a: np.ndarray, code: int) -> np.ndarray:
+    """
+    NumPy counterpart of `_transform_series` for a float64 column, or a (T × k) block of
+    columns sharing one t-code (each transformed along axis 0).
+    Matches the pandas path exactly (incl. pct_change's forward fill for code 7).
+    """
     if code == 1:
-        y = s
+        y = a
     elif code == 2:
-        y = s.diff()
+        y = _diff(a)
     elif code == 3:
-        y = s.diff().diff()
+        y = _diff(_diff(a))
     elif code == 4:
-        y = np.log(s.where(s > 0))              # domain-safe log (≤0 → NaN)
+        y = _log_pos(a)
     elif code == 5:
-        y = np.log(s.where(s > 0)).diff()
+        y = _diff(_log_pos(a))
     elif code == 6:
-        y = np.log(s.where(s > 0)).diff().diff()
+        y = _diff(_diff(_log_pos(a)))
     elif code == 7:
-        y = s.pct_change().diff()               # Δ growth
+        f = _ffill(a)
+        prev = np.empty_like(f)
+        prev[:1] = np.nan
+        prev[1:] = f[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y = _diff(f / prev - 1.0)
     else:
         raise ValueError(f"Unknown tcode: {code}. Allowed: {sorted(ALLOWED_TCODES)}")
+    return y
+
+
+@numba_kernel
+def _tcode_kernel(numba):
+    """
+    Numba-compiled, column-parallel t-code kernel (None without numba; see `numba_kernel`).
+
+    Same floating-point operations, in the same order, as `_transform_array`. The logs of
+    codes 4–6 are taken by NumPy beforehand (its vectorized log and libm's can differ in the
+    last ulp) and are expected already in `out`. fastmath stays off: it would let LLVM assume
+    there are no NaNs, and NaN propagation is part of the contract here.
+    """
+    njit, prange = numba.njit, numba.prange
+
+    # error_model="numpy": x/0 gives ±inf/NaN like NumPy instead of raising
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def kernel(values, codes, out):
+        T, N = values.shape
+        for j in prange(N):
+            code = codes[j]
+            # Level into the output column (log levels of codes 4–6 are already there)
+            if code == 4 or code == 5 or code == 6:
+                pass
+            elif code == 7:
+                last = np.nan  # forward fill, leading NaNs stay NaN
+                for i in range(T):
+                    x = values[i, j]
+                    if not np.isnan(x):
+                        last = x
+                    out[i, j] = last
+                # Simple growth x_t/x_{t-1} − 1, in place from the end
+                for i in range(T - 1, 0, -1):
+                    out[i, j] = out[i, j] / out[i - 1, j] - 1.0
+                if T > 0:
+                    out[0, j] = np.nan
+            else:
+                for i in range(T):
+                    out[i, j] = values[i, j]
+            # Differencing, in place from the end (first rows become NaN)
+            n_diff = 2 if (code == 3 or code == 6) else (1 if (code == 2 or code == 5 or code == 7) else 0)
+            for _ in range(n_diff):
+                for i in range(T - 1, 0, -1):
+                    out[i, j] = out[i, j] - out[i - 1, j]
+                if T > 0:
+                    out[0, j] = np.nan
+
+    return kernel
+
+
+@lru_cache(maxsize=32)
+def _code_plan(codes_key: bytes) -> Tuple[Tuple[Tuple[int, np.ndarray], ...], np.ndarray, Optional[int]]:
+    """
+    Dispatch plan for one column -> t-code vector (int64 bytes): the (code, column positions)
+    blocks, the positions of the log codes (4–6) and the first unknown code (or None).
+    Vintages reuse the same map, so the grouping is worked out once per distinct vector.
+    """
+    codes = np.frombuffer(codes_key, dtype=np.int64)
+    bad = np.flatnonzero(~allowed_tcode_mask(codes))
+    blocks = []
+    for code in np.unique(codes):
+        idx = np.flatnonzero(codes == code)
+        idx.flags.writeable = False  # shared through the cache
+        blocks.append((int(code), idx))
+    logged = np.flatnonzero((codes >= 4) & (codes <= 6))
+    logged.flags.writeable = False
+    return tuple(blocks), logged, (int(codes[bad[0]]) if bad.size else None)
+
+
+def apply_tcode_transformations_into(
+    values: np.ndarray, codes: np.ndarray, out: np.ndarray
+) -> None:
+    """
+    Array-level core of `apply_tcode_transformations`: write the transform of column j of
+    `values` (n × p float64, time ascending) under t-code `codes[j]` into `out[:, j]`.
+
+    `out` must be preallocated with the shape of `values`; ±inf are replaced by NaN in place.
+    Lets callers build the output frame around `out` without an intermediate DataFrame.
+    """
+    if values.shape != out.shape or codes.shape != (values.shape[1],):
+        raise ValueError(
+            f"Shape mismatch: values {values.shape}, out {out.shape}, codes {codes.shape}"
+        )
+    blocks, logged, bad = _code_plan(np.asarray(codes, dtype=np.int64).tobytes())
+    # Codes are validated here, in Python; neither path below has to check them
+    if bad is not None:
+        raise ValueError(f"Unknown tcode: {bad}. Allowed: {sorted(ALLOWED_TCODES)}")
+    kernel = _tcode_kernel()
+    if kernel is not None and values.dtype == np.float64 and out.dtype == np.float64:
+        _transform_compiled(kernel, values, codes, logged, out)
+    else:
+        _transform_blocks(values, blocks, out)
 
     # Clean up numeric artifacts
-    y = y.replace([np.inf, -np.inf], np.nan)
-    return y
+    out[np.isinf(out)] = np.nan
 
 
-def apply_tcode_transformations(df: pd.DataFrame, tcode_map: Dict[str, int]) -> pd.DataFrame:
+def _transform_compiled(kernel, values: np.ndarray, codes: np.ndarray, logged: np.ndarray, out: np.ndarray) -> None:
+    """Compiled path: NumPy logs for codes 4–6, then one pass with columns spread over threads."""
+    if logged.size:
+        out[:, logged] = _log_pos(values[:, logged])
+    kernel(values, np.asarray(codes, dtype=np.int64), out)
+
+
+def _transform_blocks(values: np.ndarray, blocks, out: np.ndarray) -> None:
+    """NumPy path: one vectorized pass per distinct code (≤ 7) over the block of columns sharing it."""
+    for code, idx in blocks:
+        out[:, idx] = _transform_array(values[:, idx], code)
+
+
+def _tcode_buffer(df: pd.DataFrame, tcode_map: Dict[str, int]) -> Tuple[np.ndarray, pd.Index, pd.Index]:
     """
-    Column-wise transforms per tcode_map. Same index as df; leading NaNs by design.
+    Validate, sort and transform `df` per tcode_map into a freshly allocated float64 array.
+    Returns (out, index, columns); the caller owns `out` and may modify it in place.
     """
     # Ensure time order (safe no-op if already sorted)
     if not df.index.is_monotonic_increasing:
@@ -52,12 +222,34 @@ def apply_tcode_transformations(df: pd.DataFrame, tcode_map: Dict[str, int]) ->
     missing = [c for c in df.columns if c not in tcode_map]
     if missing:
         raise KeyError(f"No tcode provided for columns: {missing}")
-    invalid = {k: v for k, v in tcode_map.items() if int(v) not in ALLOWED_TCODES}
-    if invalid:
+    keys = list(tcode_map)
+    map_codes = np.fromiter((int(v) for v in tcode_map.values()), dtype=np.int64, count=len(keys))
+    bad = np.flatnonzero(~allowed_tcode_mask(map_codes))
+    if bad.size:
+        invalid = {keys[i]: tcode_map[keys[i]] for i in bad}
         raise ValueError(f"Invalid tcodes detected: {invalid}. Allowed: {sorted(ALLOWED_TCODES)}")
 
-    transformed = {col: _transform_series(df[col], int(tcode_map[col])) for col in df.columns}
-    return pd.DataFrame(transformed, index=df.index)
+    # Coerce messy tokens -> NaN only where needed, then one float64 buffer
+    non_numeric = [c for c in df.columns if not pd.api.types.is_numeric_dtype(df[c])]
+    if non_numeric:
+        df = df.assign(**{c: pd.to_numeric(df[c], errors="coerce") for c in non_numeric})
+    values = df.to_numpy(dtype=np.float64)
+    codes = np.fromiter((int(tcode_map[c]) for c in df.columns), dtype=np.int8, count=df.shape[1])
+
+    out = np.empty_like(values)
+    apply_tcode_transformations_into(values, codes, out)
+    return out, df.index, df.columns
+
+
+def apply_tcode_transformations(df: pd.DataFrame, tcode_map: Dict[str, int]) -> pd.DataFrame:
+    """
+    Column-wise transforms per tcode_map. Same index as df; leading NaNs by design.
+
+    Runs on one float64 buffer, transforming all columns that share a t-code as
+    one block, and fills a preallocated output instead of building a Series per step.
+    """
+    out, index, columns = _tcode_buffer(df, tcode_map)
+    return pd.DataFrame(out, index=index, columns=columns, copy=False)
 
 
 def standardize(
@@ -68,7 +260,12 @@ def standardize(
     Returns (Z, means, stds). Zero std → NaN (prevents infs).
     """
     mu = df.mean(skipna=True)
-    sigma = df.std(ddof=ddof, skipna=True).replace({0.0: np.nan})
-    z = (df - mu) / sigma
+    sigma = df.std(ddof=ddof, skipna=True)
+    sigma[sigma.to_numpy() == 0.0] = np.nan
+    # One owned float64 buffer, centred and scaled in place (no pandas temporaries)
+    arr = df.to_numpy(dtype=np.float64, copy=True)
+    arr -= mu.to_numpy()
+    arr /= sigma.to_numpy()
+    z = pd.DataFrame(arr, index=df.index, columns=df.columns, copy=False)
     return z, mu, sigma
 
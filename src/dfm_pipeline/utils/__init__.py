@@ -1,4 +1,28 @@
-from .io import load_panel_csv, write_panel_csv
-from .dates import ensure_monthly_index
-from .naming import clean_columns, clean_colname
-from .checks import assert_unique_columns  # optional
+# Re-exports are resolved lazily (PEP 562) so that importing a light submodule such as
+# dfm_pipeline.utils.config_loader does not pull in pandas through this package.
+import importlib
+
+_LAZY_EXPORTS = {
+    "load_panel_csv": ".io",
+    "write_panel_csv": ".io",
+    "ensure_monthly_index": ".dates",
+    "clean_columns": ".naming",
+    "clean_colname": ".naming",
+    "assert_unique_columns": ".checks",  # optional
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
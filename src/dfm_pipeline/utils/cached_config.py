@@ -0,0 +1,111 @@
+# src/dfm_pipeline/utils/cached_config.py
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+import codecs
+import json
+import os
+import sys
+
+# Optional faster JSON parser; stdlib json is the fallback
+try:
+    import orjson  # type: ignore[import-not-found]
+    _HAVE_ORJSON = True
+except Exception:
+    _HAVE_ORJSON = False
+
+
+__all__ = ["load_yaml", "load_json", "dump_json", "dump_json_lines"]
+
+
+def _decode_text(raw: bytes, path: str) -> str:
+    """Decode config bytes: UTF-8 (BOM tolerated), cp1252 as a last resort."""
+    if raw.startswith(codecs.BOM_UTF8):
+        print(f"[warn] Read {path} with UTF-8 BOM; consider re-saving as plain UTF-8.", file=sys.stderr)
+        return raw[len(codecs.BOM_UTF8):].decode("utf-8")
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        print(f"[warn] Read {path} with cp1252; consider re-saving as UTF-8 to avoid surprises.",
+              file=sys.stderr)
+        return raw.decode("cp1252")
+
+
+@lru_cache(maxsize=32)
+def _load_yaml(path: str, mtime: float) -> dict:
+    """Parse a YAML file once per (path, mtime). `mtime` only participates in the cache key."""
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it; same semantics as safe_load
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    text = _decode_text(Path(path).read_bytes(), path)
+    return yaml.load(text, Loader=loader) or {}
+
+
+@lru_cache(maxsize=32)
+def _load_json(path: str, mtime: float) -> Any:
+    """Parse a JSON file once per (path, mtime). `mtime` only participates in the cache key."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if _HAVE_ORJSON else json.loads(raw)
+
+
+def load_yaml(path: str | Path) -> dict:
+    """
+    Load a YAML file, memoized on (absolute path, modification time).
+    Bytes are read once; a UTF-8 BOM or cp1252 content is accepted with a warning.
+
+    Editing the file invalidates the entry on the next call. The returned dict is shared
+    between callers: treat it as read-only.
+    """
+    p = os.path.abspath(path)
+    return _load_yaml(p, os.path.getmtime(p))
+
+
+def load_json(path: str | Path) -> Any:
+    """
+    Load a JSON file, memoized on (absolute path, modification time).
+
+    Editing the file invalidates the entry on the next call. The returned object is shared
+    between callers: treat it as read-only.
+    """
+    p = os.path.abspath(path)
+    return _load_json(p, os.path.getmtime(p))
+
+
+def _json_default(o: Any) -> Any:
+    """stdlib fallback for NumPy scalars/arrays (orjson handles them natively)."""
+    if hasattr(o, "tolist"):
+        return o.tolist()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dump_json(obj: Any, path: str | Path, *, sort_keys: bool = False) -> None:
+    """
+    Write `obj` as 2-space indented JSON (UTF-8), via orjson when available.
+
+    Same layout as json.dump(obj, f, indent=2, sort_keys=sort_keys); keys must be strings.
+    NumPy scalars/arrays are serialized as plain numbers/lists.
+    """
+    if _HAVE_ORJSON:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        Path(path).write_bytes(orjson.dumps(obj, option=option))
+    else:
+        text = json.dumps(obj, indent=2, sort_keys=sort_keys, default=_json_default)
+        Path(path).write_text(text, encoding="utf-8")
+
+
+def dump_json_lines(records: Iterable[Any], path: str | Path) -> None:
+    """
+    Write one compact JSON document per line (JSON Lines, UTF-8), via orjson when available.
+    Lines are serialized into one buffer and written with a single call.
+    """
+    if _HAVE_ORJSON:
+        option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+        data = b"".join(orjson.dumps(rec, option=option) for rec in records)
+    else:
+        data = "".join(json.dumps(rec, default=_json_default) + "\n" for rec in records).encode("utf-8")
+    Path(path).write_bytes(data)
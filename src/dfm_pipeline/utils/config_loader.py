@@ -1,10 +1,14 @@
 import os
-import yaml
+
+from dfm_pipeline.utils.cached_config import load_yaml
 
 def load_config(config_path: str = "config.yaml") -> dict:
     """
     Load the YAML configuration file as a Python dictionary.
 
+    Parsed once per (path, mtime): repeated calls (e.g. download_csv in a loop over
+    vintages) reuse the cached dict until the file changes. Treat it as read-only.
+
     Args:
         config_path (str): Relative path to the YAML config file.
 
@@ -14,7 +18,4 @@ def load_config(config_path: str = "config.yaml") -> dict:
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, "r") as file:
-        config = yaml.safe_load(file)
-
-    return config
+    return load_yaml(config_path)
@@ -1,10 +1,33 @@
 # src/dfm_pipeline/utils/data_loader.py
 
+import csv
 import os
 import pandas as pd
 from dfm_pipeline.utils.config_loader import load_config
 
 
+def data_path(stage: str = "raw") -> str:
+    """Resolve the CSV path for a given stage ('raw' or 'processed') from config."""
+    config = load_config()
+
+    if stage == "raw":
+        return os.path.join("data", "raw_data", config["paths"]["raw_filename"])
+    elif stage == "processed":
+        return os.path.join("data", "processed_data", config["paths"]["processed_filename"])
+    else:
+        raise ValueError("stage must be 'raw' or 'processed'")
+
+
+def load_headers(path: str) -> list[str]:
+    """
+    Return the column names of a CSV by reading only its header line.
+
+    Much cheaper than loading the frame when only the series names are needed.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return next(csv.reader(f), [])
+
+
 def load_data(stage: str = "raw") -> tuple[pd.DataFrame, pd.Series]:
     """
     Load dataset and transformation codes for a given stage.
@@ -12,31 +35,28 @@ def load_data(stage: str = "raw") -> tuple[pd.DataFrame, pd.Series]:
     Returns:
         Tuple of:
         - df: time-indexed DataFrame of macroeconomic series
-        - transform_codes: Series containing transformation codes per column
+        - transform_codes: float64 Series of the embedded t-codes (file row 1), indexed by
+          series name in column order; NaN where a cell is blank or not numeric
     """
-    config = load_config()
-
-    if stage == "raw":
-        path = os.path.join("data", "raw_data", config["paths"]["raw_filename"])
-    elif stage == "processed":
-        path = os.path.join("data", "processed_data", config["paths"]["processed_filename"])
-    else:
-        raise ValueError("stage must be 'raw' or 'processed'")
+    path = data_path(stage)
 
     if not os.path.exists(path):
         raise FileNotFoundError(f"File not found at: {path}")
 
-    # Load transformation codes (row 2, after header row)
-    transform_codes_df = pd.read_csv(path, nrows=1, skiprows=1)
-    transform_codes = transform_codes_df.squeeze()  # Turn DataFrame into Series
-
-    # Load actual data (starting from row 3), parse sasdate as datetime index
-    df = pd.read_csv(
-        path,
-        skiprows=[1],  # skip the row with transformation codes
-        parse_dates=["sasdate"],
-        index_col="sasdate"
-    )
+    # One read of the whole file (Arrow CSV reader when available): the t-code row comes back
+    # as the first data row, so codes and data are split in memory instead of re-reading.
+    # sasdate stays text during the read ("Transform:" sits in the t-code row).
+    from dfm_pipeline.utils.io import read_csv_fast
+
+    raw = read_csv_fast(path, date_col="sasdate")
+
+    # Transformation codes (row 2, after header row), indexed by series name. Always float64,
+    # so a blank code doesn't change the dtype
+    transform_codes = pd.to_numeric(raw.iloc[0].drop("sasdate"), errors="coerce").astype("float64").rename(None)
+
+    # Actual data (starting from row 3); sasdate parsed (format inferred, as before) into the index
+    df = raw.iloc[1:]
+    df = df.set_index(pd.DatetimeIndex(pd.to_datetime(df["sasdate"]), name="sasdate")).drop(columns="sasdate")
 
     return df, transform_codes
 
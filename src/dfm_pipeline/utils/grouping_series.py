@@ -164,8 +164,32 @@ VARIABLE_GROUP_MAP = {
     "VIXCLSx": "Stock Market",
 }
 
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
+# Group labels in first-seen order; fixed categories for the per-column Categorical
+_GROUP_CATEGORIES = list(dict.fromkeys(VARIABLE_GROUP_MAP.values()))
+
+
+@lru_cache(maxsize=16)
+def _column_groups(columns: tuple) -> pd.Categorical:
+    """Group of each column as a Categorical (unmapped → NaN), computed once per column set."""
+    return pd.Categorical(
+        [VARIABLE_GROUP_MAP.get(c) for c in columns], categories=_GROUP_CATEGORIES
+    )
+
+
+def column_groups(df: pd.DataFrame) -> pd.Categorical:
+    """
+    Categorical of group labels aligned with df.columns (NaN where a column is unmapped).
+
+    Memoized on the tuple of column names, so repeated calls on the same panel are free.
+    """
+    return _column_groups(tuple(df.columns))
+
+
 def assign_variable_groups(df: pd.DataFrame) -> pd.Series:
     """
     Assign group labels to each column in the DataFrame using VARIABLE_GROUP_MAP.
@@ -174,9 +198,10 @@ def assign_variable_groups(df: pd.DataFrame) -> pd.Series:
         df (pd.DataFrame): DataFrame containing macroeconomic time series.
 
     Returns:
-        pd.Series: Series where the index is variable names and the value is the group.
+        pd.Series: Categorical series where the index is variable names and the value is
+            the group (NaN for unmapped variables).
     """
-    return df.columns.to_series().map(VARIABLE_GROUP_MAP)
+    return pd.Series(column_groups(df), index=df.columns)
 
 
 def filter_by_group(df: pd.DataFrame, group_name: str) -> pd.DataFrame:
@@ -190,9 +215,11 @@ def filter_by_group(df: pd.DataFrame, group_name: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: A subset of the original DataFrame with only columns in that group.
     """
-    group_series = assign_variable_groups(df)
-    selected_vars = group_series[group_series == group_name].index
-    return df[selected_vars]
+    groups = column_groups(df)
+    code = groups.categories.get_indexer([group_name])[0]  # -1 for an unknown group
+    if code < 0:
+        return df.iloc[:, []]
+    return df.iloc[:, np.flatnonzero(groups.codes == code)]
 
 
 def create_metadata_df(df: pd.DataFrame) -> pd.DataFrame:
@@ -207,5 +234,5 @@ def create_metadata_df(df: pd.DataFrame) -> pd.DataFrame:
     """
     return pd.DataFrame({
         "variable": df.columns,
-        "group": df.columns.map(VARIABLE_GROUP_MAP)
+        "group": column_groups(df)
     })
@@ -1,37 +1,261 @@
 from __future__ import annotations
 from pathlib import Path
+from typing import Sequence
+import csv
+import io
+import os
+import re
+import numpy as np
 import pandas as pd
 
+# Optional: Arrow's multithreaded CSV reader (falls back to pandas' C engine)
+try:
+    import pyarrow as pa  # type: ignore[import-not-found]
+    import pyarrow.csv as pacsv  # type: ignore[import-not-found]
+    _HAVE_PYARROW = True
+except Exception:
+    _HAVE_PYARROW = False
+
 DATE_COL = "sasdate"
 
+# Characters that make a CSV cell need quoting
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
+
+def read_csv_fast(
+    p: Path,
+    skiprows: Sequence[int] | None = None,
+    *,
+    date_col: str | None = None,
+    date_fmt: str | None = None,
+    usecols: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read a CSV with a header row into a plain DataFrame (no index).
+
+    Uses pyarrow's CSV reader when available. `skiprows` follows pandas semantics (0-based
+    file rows, header = row 0); pyarrow only supports skipping a contiguous block right after
+    the header, so anything else goes through pandas.
+
+    With `date_col` and `date_fmt`, that column is parsed to datetime64[ns] during the read
+    (unparseable entries → NaT). With `date_col` alone it is kept as text, as pandas does.
+
+    `usecols` limits the read to those columns (returned in that order); the other columns
+    are skipped by the tokenizer instead of being parsed and dropped. Unknown names raise
+    ValueError, as in pandas.
+    """
+    p = Path(p)
+    skip = sorted(skiprows or [])
+    if _HAVE_PYARROW and skip == list(range(1, len(skip) + 1)):
+        column_types, parsers = {}, None
+        if date_col is not None and date_fmt is not None:
+            column_types[date_col], parsers = pa.timestamp("s"), [date_fmt]
+        elif date_col is not None:
+            column_types[date_col] = pa.string()  # keep e.g. ISO dates from becoming date32
+        try:
+            table = pacsv.read_csv(
+                p,
+                read_options=pacsv.ReadOptions(skip_rows_after_names=len(skip)),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=column_types,
+                    timestamp_parsers=parsers,
+                    include_columns=list(usecols) if usecols is not None else None,
+                ),
+            )
+        except (pa.ArrowInvalid, pa.ArrowKeyError):
+            # Type conflict, a date not matching date_fmt or an unknown usecols name;
+            # let pandas handle it (and raise its usual error)
+            table = None
+        # Duplicate header names also go to pandas, which mangles them ("x", "x.1")
+        if table is not None and len(set(table.column_names)) == table.num_columns:
+            df = table.to_pandas()
+            # All-empty columns come back as object/None; match pandas' float64 NaN
+            null_cols = [f.name for f in table.schema if pa.types.is_null(f.type)]
+            if null_cols:
+                df[null_cols] = df[null_cols].astype("float64")
+            if parsers is not None:
+                df[date_col] = df[date_col].astype("datetime64[ns]")
+            return df
+    df = pd.read_csv(p, skiprows=skip or None, usecols=usecols)
+    if usecols is not None:
+        df = df[list(usecols)]
+    if date_col is not None and date_fmt is not None and date_col in df.columns:
+        df[date_col] = pd.to_datetime(df[date_col], format=date_fmt, errors="coerce")
+    return df
+
 def load_panel_csv(p: Path, date_fmt: str = "%m/%d/%Y") -> pd.DataFrame:
     """
     Load a panel CSV where 'sasdate' might be an index or a column.
     Return a DataFrame with a DatetimeIndex named 'sasdate', sorted.
     """
     p = Path(p)
-    try:
-        df = pd.read_csv(p, parse_dates=[DATE_COL], index_col=DATE_COL)
-    except Exception:
-        df = pd.read_csv(p)
-        if DATE_COL not in df.columns:
-            raise ValueError(f"{p}: '{DATE_COL}' not found as index or column.")
-        df[DATE_COL] = pd.to_datetime(df[DATE_COL], format=date_fmt, errors="coerce")
-        df = df.set_index(DATE_COL)
-    df = df.sort_index()
+    df = read_csv_fast(p, date_col=DATE_COL, date_fmt=date_fmt)  # dates parsed inside the read
+    if DATE_COL not in df.columns:
+        raise ValueError(f"{p}: '{DATE_COL}' not found as index or column.")
+    df = df.set_index(DATE_COL)
+    if not df.index.is_monotonic_increasing:  # panels are normally written in date order
+        df = df.sort_index()
     df.index.name = DATE_COL
     return df
 
+def load_panel_prefer_parquet(p: Path, date_fmt: str = "%m/%d/%Y") -> pd.DataFrame:
+    """
+    Like load_panel_csv, but read the `.parquet` sibling of `p` when it exists and is at least
+    as new as the CSV (typed, columnar: no tokenizing or date parsing). A stale or unreadable
+    Parquet file falls back to the CSV. df.attrs["source"] records the file actually read.
+    """
+    p = Path(p)
+    pq_path = p.with_suffix(".parquet")
+    if pq_path.exists() and (not p.exists() or pq_path.stat().st_mtime >= p.stat().st_mtime):
+        try:
+            df = pd.read_parquet(pq_path)
+        except (ImportError, OSError, ValueError):
+            pass  # no engine / corrupt file: the CSV is the source of truth
+        else:
+            if DATE_COL in df.columns:
+                df = df.set_index(DATE_COL)
+            if isinstance(df.index, pd.DatetimeIndex):
+                if not df.index.is_monotonic_increasing:
+                    df = df.sort_index()
+                df.index.name = DATE_COL
+                df.attrs["source"] = str(pq_path)
+                return df
+    df = load_panel_csv(p, date_fmt=date_fmt)
+    df.attrs["source"] = str(p)
+    return df
+
 def write_panel_csv(
     df: pd.DataFrame,
     path: Path,
     date_fmt: str = "%m/%d/%Y",
     float_fmt: str = "%.10g",
     index_label: str = DATE_COL,
+    *,
+    parquet_sibling: bool = False,
 ) -> None:
+    """
+    Write the panel as CSV; `index_label` names the index column without copying the frame.
+
+    With parquet_sibling=True, also write `path.with_suffix(".parquet")` (zstd, full precision)
+    after the CSV, so load_panel_prefer_parquet picks it up. Skipped with a warning when
+    pyarrow is missing.
+    """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    df = df.copy()
-    df.index.name = index_label
     df.to_csv(path, index_label=index_label, date_format=date_fmt, float_format=float_fmt)
+    if parquet_sibling:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            print(f"[WARN] Parquet write skipped ({e}).")
+            return
+        named = df.copy(deep=False)  # shallow: only the index name differs
+        named.index = named.index.rename(index_label)  # new Index; df's stays untouched
+        pq.write_table(pa.Table.from_pandas(named), path.with_suffix(".parquet"), compression="zstd")
 
+def write_panel_csv_arrow(
+    df: pd.DataFrame,
+    path: Path,
+    date_fmt: str = "%m/%d/%Y",
+    index_label: str = DATE_COL,
+) -> None:
+    """
+    Same layout as write_panel_csv, serialized by pyarrow's C++ CSV writer.
+
+    Floats are written at full round-trip precision (there is no float_fmt) and NaN as an
+    empty cell. Falls back to write_panel_csv (%.10g text) without pyarrow, with a warning,
+    or if a value needs quoting. pyarrow is optional, so callers use this opt-in only.
+    """
+    path = Path(path)
+    if not _HAVE_PYARROW:
+        print(f"[WARN] pyarrow not installed; writing {path} with %.10g floats instead.")
+        write_panel_csv(df, path, date_fmt=date_fmt, index_label=index_label)
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    dates = pa.array(pd.DatetimeIndex(df.index).strftime(date_fmt), type=pa.string())
+    table = pa.Table.from_pandas(df, preserve_index=False).add_column(0, index_label, dates)
+
+    # Arrow always quotes the header; emit it the way pandas does and let Arrow write the body
+    header = io.StringIO()
+    csv.writer(header, lineterminator="\n").writerow([index_label, *map(str, df.columns)])
+    try:
+        with path.open("wb") as f:
+            f.write(header.getvalue().encode("utf-8"))
+            pacsv.write_csv(
+                table, f, write_options=pacsv.WriteOptions(include_header=False, quoting_style="none")
+            )
+    except pa.ArrowInvalid:
+        write_panel_csv(df, path, date_fmt=date_fmt, index_label=index_label)
+
+def fast_to_csv(
+    df: pd.DataFrame,
+    path: Path,
+    date_fmt: str | None = "%m/%d/%Y",
+    float_fmt: str | None = "%.10g",
+    na_rep: str = "",
+    index_label: str | None = DATE_COL,
+    index: bool = True,
+) -> None:
+    """
+    Vectorized stand-in for DataFrame.to_csv.
+
+    Float columns are formatted in one np.char.mod call (C-level printf over the whole block)
+    rather than pandas' per-cell writer; other columns are stringified per array. The text
+    matches df.to_csv(index=..., index_label=..., date_format=date_fmt,
+    float_format=float_fmt, na_rep=na_rep), where None keeps pandas' default rendering.
+    Text cells that would need CSV quoting send the frame through pandas instead.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _text(values) -> np.ndarray:
+        if pd.api.types.is_datetime64_any_dtype(values):
+            dt = pd.DatetimeIndex(values)
+            out = dt.strftime(date_fmt) if date_fmt is not None else dt.astype(str)
+            return np.where(dt.isna(), na_rep, np.asarray(out, dtype=object)).astype(str)
+        arr = np.asarray(values)
+        if pd.api.types.is_float_dtype(arr) and float_fmt is not None:
+            return np.where(np.isnan(arr), na_rep, np.char.mod(float_fmt, arr))
+        return np.where(pd.isna(arr), na_rep, arr.astype(str))
+
+    names = [*map(str, df.columns)]
+    blocks = [df[c] for c in df.columns]
+    if index:
+        names.insert(0, index_label if index_label is not None else (df.index.name or ""))
+        blocks.insert(0, df.index)
+    if not blocks:
+        df.to_csv(path, index=index, index_label=index_label, date_format=date_fmt,
+                  float_format=float_fmt, na_rep=na_rep)
+        return
+
+    cols = [_text(b) for b in blocks]
+    # Numbers never contain a delimiter/quote; any other column (object, category, string,
+    # formatted dates) is scanned. The header goes through csv.writer, which quotes like pandas
+    if any(
+        not pd.api.types.is_numeric_dtype(b.dtype) and any(_CSV_SPECIAL.search(v) for v in col)
+        for b, col in zip(blocks, cols)
+    ):
+        df.to_csv(path, index=index, index_label=index_label, date_format=date_fmt,
+                  float_format=float_fmt, na_rep=na_rep)
+        return
+
+    rows = np.stack(cols, axis=1)
+    header = io.StringIO()
+    csv.writer(header, lineterminator="").writerow(names)
+    np.savetxt(path, rows, fmt="%s", delimiter=",", header=header.getvalue(), comments="", encoding="utf-8")
+
+def save_panel_csv(
+    df: pd.DataFrame,
+    path: Path,
+    date_fmt: str = "%m/%d/%Y",
+    index_label: str = DATE_COL,
+) -> None:
+    """
+    The pipeline's panel CSV writer: %.10g text via fast_to_csv (same bytes as to_csv).
+    DFM_ARROW_CSV=1 switches to write_panel_csv_arrow (full-precision floats, needs pyarrow).
+    """
+    if os.getenv("DFM_ARROW_CSV") == "1":
+        write_panel_csv_arrow(df, path, date_fmt=date_fmt, index_label=index_label)
+    else:
+        fast_to_csv(df, path, date_fmt=date_fmt, float_fmt="%.10g", index_label=index_label)
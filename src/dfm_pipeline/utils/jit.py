@@ -0,0 +1,29 @@
+# src/dfm_pipeline/utils/jit.py
+from __future__ import annotations
+
+from functools import lru_cache, wraps
+from typing import Any, Callable, Optional
+
+__all__ = ["numba_kernel"]
+
+
+def numba_kernel(factory: Callable[[Any], Callable]) -> Callable[[], Optional[Callable]]:
+    """
+    Decorator for an optional Numba kernel. `factory(numba)` builds and returns the compiled
+    function; the decorated name becomes a memoized accessor that returns that kernel, or
+    None if 'numba' is not installed (callers keep a NumPy fallback for that case).
+
+    numba is imported and the kernel compiled on the first call, not at import time, so
+    modules defining kernels stay cheap to import. Kernels should use
+    numba.njit(cache=True, ...) so the compiled code is reused across processes.
+    """
+    @lru_cache(maxsize=None)
+    @wraps(factory)
+    def accessor() -> Optional[Callable]:
+        try:
+            import numba  # type: ignore[import-not-found]
+        except Exception:
+            return None
+        return factory(numba)
+
+    return accessor
@@ -1,17 +1,18 @@
 # src/dfm_pipeline/utils/metadata_tools.py
+from pathlib import Path
 
-def extract_series_labels(df, output_path: str = "series_labels.txt") -> None:
+def extract_series_labels(cols, output_path: str = "series_labels.txt") -> None:
     """
-    Write a list of column names (series labels) from a DataFrame to a text file.
+    Write a list of column names (series labels) to a text file.
 
     Args:
-        df (pd.DataFrame): DataFrame containing FRED-MD series.
+        cols (list[str] | pd.DataFrame): Column names (e.g. from load_headers), or a
+            DataFrame containing FRED-MD series whose columns are used.
         output_path (str): Path to the output .txt file.
     """
-    series_labels = df.columns.tolist()
+    series_labels = list(getattr(cols, "columns", cols))
 
-    with open(output_path, "w") as f:
-        for label in series_labels:
-            f.write(label + "\n")
+    # One joined buffer, one write (UTF-8, "\n" line endings on every platform)
+    Path(output_path).write_bytes("".join(f"{label}\n" for label in series_labels).encode("utf-8"))
 
     print(f"Exported {len(series_labels)} series labels to {output_path}")
@@ -1,14 +1,21 @@
 from __future__ import annotations
+from functools import lru_cache
 import unicodedata
 import pandas as pd
 
+# Column names repeat across loads and vintages: normalize each distinct label once.
+# typed=True keeps e.g. 1 and 1.0 apart (they hash equal but render differently).
+@lru_cache(maxsize=4096, typed=True)
 def clean_colname(name: str) -> str:
     s = unicodedata.normalize("NFKC", str(name)).strip()
     s = s.replace(" ", "_")
     return s
 
 def clean_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Return a copy with sanitized column names."""
-    out = df.copy()
+    """
+    Return a shallow copy with sanitized column names.
+    The data is not duplicated: without copy-on-write, in-place edits to the values are shared with df.
+    """
+    out = df.copy(deep=False)
     out.columns = [clean_colname(c) for c in out.columns]
     return out
@@ -0,0 +1,26 @@
+# src/dfm_pipeline/utils/parallel.py
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = ["limit_worker_threads"]
+
+# threadpoolctl limiter held for the worker's lifetime (None without threadpoolctl)
+_THREAD_LIMITS: Any = None
+
+
+def limit_worker_threads() -> None:
+    """
+    Process-pool initializer: cap the BLAS/OpenMP pools at one thread per worker process,
+    so N workers don't each start a full-size pool.
+
+    numpy (and its BLAS) is usually loaded by the time this runs (forked workers inherit
+    it), so the *_NUM_THREADS variables would be read too late; threadpoolctl resizes the
+    loaded pools instead. Without it the pools keep their default size.
+    """
+    global _THREAD_LIMITS
+    try:
+        from threadpoolctl import threadpool_limits  # type: ignore[import-not-found]
+    except ImportError:
+        return
+    _THREAD_LIMITS = threadpool_limits(limits=1)
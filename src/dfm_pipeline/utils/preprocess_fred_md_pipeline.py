@@ -1,7 +1,9 @@
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 
+from dfm_pipeline.utils.cached_config import load_json
+from dfm_pipeline.utils.data_loader import load_headers
 from dfm_pipeline.utils.series_transformations import (
     apply_tcode_transformations, standardize
 )
@@ -25,12 +27,23 @@ def transform_from_csv_and_json(
     - df_final (pd.DataFrame): Transformed (and optionally standardized) DataFrame
     """
 
-    # Load raw dataset (skip second row with transformation codes)
-    df = pd.read_csv(csv_path, skiprows=[1], parse_dates=["sasdate"], index_col="sasdate")
-
-    # Load transformation mapping
-    with open(tcode_json_path, "r") as f:
-        tcode_map = json.load(f)
+    # Load raw dataset (skip second row with transformation codes).
+    # Schema comes from the header line: explicit date format and float64 series
+    # skip pandas' date and dtype inference.
+    columns = load_headers(csv_path)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        # The t-code map is read on a worker thread while the CSV is parsed here
+        # (memoized on path + mtime; treated as read-only below)
+        tcode_future = ex.submit(load_json, tcode_json_path)
+        df = pd.read_csv(
+            csv_path,
+            skiprows=[1],
+            index_col="sasdate",
+            parse_dates=["sasdate"],
+            date_format="%m/%d/%Y",
+            dtype={c: "float64" for c in columns if c != "sasdate"},
+        )
+        tcode_map = tcode_future.result()
 
     # Apply transformations
     df_transformed = apply_tcode_transformations(df, tcode_map)
@@ -1,10 +1,10 @@
 # src/dfm_pipeline/utils/raw_inspector.py
 
-import pandas as pd
+from dfm_pipeline.utils.data_loader import load_headers
 
 def inspect_raw_csv(filepath: str = "data/raw_data/fred_md_current.csv"):
     """
-    Load and inspect the raw CSV file without parsing or indexing.
+    Inspect the raw CSV file's columns; only the header line is read.
 
     Args:
         filepath (str): Path to the raw CSV file.
@@ -12,8 +12,7 @@ def inspect_raw_csv(filepath: str = "data/raw_data/fred_md_current.csv"):
     Returns:
         tuple: Number of columns, list of column names
     """
-    df = pd.read_csv(filepath)
-    num_columns = len(df.columns)
-    column_names = df.columns.tolist()
+    column_names = load_headers(filepath)
+    num_columns = len(column_names)
 
     return num_columns, column_names
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import numpy as np
 import pandas as pd
 
@@ -14,33 +16,60 @@ def apply_tcode_transformations(df: pd.DataFrame, tcode_map: dict) -> pd.DataFra
     Returns:
     - transformed_df: DataFrame with transformed series
     """
-    def transform_series(x: pd.Series, code: int) -> pd.Series:
-        x = x.copy()
+    def checked_code(col) -> int:
+        tcode = tcode_map.get(col)
+        if tcode is None:
+            raise KeyError(f"No transformation code found for series: {col}")
+        if tcode not in (1, 2, 3, 4, 5, 6, 7):
+            raise ValueError(f"Unknown tcode: {tcode}")
+        return tcode
+
+    # One int8 code per column position, validated while it is built (no list in between)
+    codes = np.fromiter(map(checked_code, df.columns), dtype=np.int8, count=df.shape[1])
+
+    def diff(a: np.ndarray) -> np.ndarray:
+        d = np.empty_like(a)
+        d[:1] = np.nan
+        np.subtract(a[1:], a[:-1], out=d[1:])
+        return d
+
+    def log_nonzero(a: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.log(np.where(a == 0, np.nan, a))
+
+    def transform_block(a: np.ndarray, code: int) -> np.ndarray:
         if code == 1:
-            return x
+            return a
         elif code == 2:
-            return x.diff()
+            return diff(a)
         elif code == 3:
-            return x.diff().diff()
+            return diff(diff(a))
         elif code == 4:
-            return np.log(x.replace(0, np.nan))
+            return log_nonzero(a)
         elif code == 5:
-            return np.log(x.replace(0, np.nan)).diff()
+            return diff(log_nonzero(a))
         elif code == 6:
-            return np.log(x.replace(0, np.nan)).diff().diff()
-        elif code == 7:
-            return (x / x.shift(1) - 1).diff()
-        else:
-            raise ValueError(f"Unknown tcode: {code}")
-
-    transformed = {}
-    for col in df.columns:
-        tcode = tcode_map.get(col)
-        if tcode is None:
-            raise KeyError(f"No transformation code found for series: {col}")
-        transformed[col] = transform_series(df[col], tcode)
-
-    return pd.DataFrame(transformed, index=df.index)
+            return diff(diff(log_nonzero(a)))
+        else:  # 7
+            prev = np.empty_like(a)
+            prev[:1] = np.nan
+            prev[1:] = a[:-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return diff(a / prev - 1)
+
+    # Codes partition the columns into at most 7 blocks: one NumPy pass per block
+    arr = df.to_numpy(dtype=np.float64)
+    out = np.empty_like(arr)
+    for code in np.unique(codes):
+        idx = np.flatnonzero(codes == code)
+        out[:, idx] = transform_block(arr[:, idx], int(code))
+
+    transformed = pd.DataFrame(out, index=df.index, columns=df.columns, copy=False)
+    # Level (code 1) series keep their original dtype, as before
+    keep = np.flatnonzero((codes == 1) & (df.dtypes != np.float64).to_numpy())
+    for j in keep:
+        transformed.isetitem(j, df.iloc[:, j])
+    return transformed
 
 
 def standardize(df: pd.DataFrame) -> pd.DataFrame:
@@ -53,34 +82,37 @@ def standardize(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
     - standardized_df: DataFrame with standardized values
     """
-    return (df - df.mean()) / df.std()
+    # Moments from pandas (NaN-aware, as before); centre and scale in one owned buffer
+    buf = np.subtract(df.to_numpy(dtype=np.float64), df.mean().to_numpy())
+    with np.errstate(divide="ignore", invalid="ignore"):  # std 0 or NaN: quiet, as in pandas
+        np.divide(buf, df.std().to_numpy(), out=buf)
+    return pd.DataFrame(buf, index=df.index, columns=df.columns, copy=False)
 
 ###############################################################################
 
-from __future__ import annotations
-
-import json
-import hashlib
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
-
-# Allowed Stock–Watson/FRED-MD transformation codes
-_ALLOWED_TCODES = {1, 2, 3, 4, 5, 6, 7}
+from dfm_pipeline.ingestion.fred_md import (
+    _read_head,
+    _scan_tcode_row,
+    _tcode_map_from_row,
+    detect_tcode_row,
+    read_embedded_tcode_map,
+)
+from dfm_pipeline.utils.cached_config import dump_json
+from dfm_pipeline.utils.hashing import CHUNK_SIZE, sha256_file
+from dfm_pipeline.validation.tcode_map import validate_tcode_map_against_columns
 
 
 # ---------- helpers ----------
 
-def _sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    """Compute SHA-256 of a file (for provenance in metadata)."""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
-    return h.hexdigest()
+def _sha256_file(path: Path, chunk_size: int = CHUNK_SIZE) -> str:
+    """Compute SHA-256 of a file (for provenance in metadata); see utils.hashing.sha256_file."""
+    return sha256_file(path, chunk_size)
 
 
 def _detect_tcode_row(
@@ -92,21 +124,9 @@ def _detect_tcode_row(
     """
     Detect which 0-based file row (including the header row) contains the embedded t-codes.
     Typical FRED-MD files -> row 1 (i.e., second line). Returns None if not found.
+    One plain read of the leading lines; see ingestion.fred_md.detect_tcode_row.
     """
-    csv_path = Path(csv_path)
-    cols = pd.read_csv(csv_path, nrows=0).columns.tolist()
-
-    # Read a few rows after header as DATA (not header)
-    block = pd.read_csv(
-        csv_path, header=None, names=cols, skiprows=1, nrows=max_scan_rows, dtype=str
-    )
-    for i, (_, row) in enumerate(block.iterrows()):
-        vals = row.drop(labels=[date_col], errors="ignore")
-        nums = pd.to_numeric(vals, errors="coerce")
-        # A bona fide tcode row has only integers in {1..7} on non-date columns
-        if nums.notna().all() and set(nums.astype(int)).issubset(_ALLOWED_TCODES):
-            return 1 + i
-    return None
+    return detect_tcode_row(csv_path, date_col=date_col, max_scan_rows=max_scan_rows)
 
 
 def _read_embedded_tcode_map(
@@ -115,15 +135,9 @@ def _read_embedded_tcode_map(
     """
     Read the embedded t-code row and return {series_name: tcode}.
     Assumes header is at row 0 and tcode_row is 0-based (including header).
+    One plain read of the leading lines; see ingestion.fred_md.read_embedded_tcode_map.
     """
-    csv_path = Path(csv_path)
-    cols = pd.read_csv(csv_path, nrows=0).columns.tolist()
-    row = pd.read_csv(
-        csv_path, header=None, names=cols, skiprows=tcode_row, nrows=1, dtype=str
-    ).iloc[0]
-    series = pd.to_numeric(row.drop(labels=[date_col], errors="ignore"), errors="coerce")
-    # Keep only valid codes in {1..7}
-    return {k: int(v) for k, v in series.dropna().items() if int(v) in _ALLOWED_TCODES}
+    return read_embedded_tcode_map(csv_path, date_col=date_col, tcode_row=tcode_row)
 
 
 def _validate_tcode_map_against_columns(
@@ -135,25 +149,11 @@ def _validate_tcode_map_against_columns(
 ) -> Tuple[Dict[str, int], Dict]:
     """
     Clean & check the map against actual data columns (without reading data rows).
+    Set lookups and a bitmask code test; see validation.tcode_map.validate_tcode_map_against_columns.
     """
-    cols = [c for c in df_columns if c != date_col]
-
-    cleaned: Dict[str, int] = {}
-    for k, v in tcode_map.items():
-        try:
-            iv = int(v)
-        except (TypeError, ValueError):
-            iv = np.nan
-        if k in cols and iv in _ALLOWED_TCODES:
-            cleaned[k] = int(iv)
-
-    missing = [c for c in cols if c not in cleaned]
-    extra = [k for k in tcode_map if k not in cols and k != date_col]
-
-    if require_all and missing:
-        raise KeyError(f"No tcode for columns: {missing}")
-
-    return cleaned, {"missing_in_tcodes": missing, "extra_in_tcodes": extra}
+    return validate_tcode_map_against_columns(
+        df_columns, tcode_map, date_col=date_col, require_all=require_all
+    )
 
 
 # ---------- public API for Step A ----------
@@ -200,20 +200,24 @@ def extract_tcodes_to_json(
     csv_path = Path(csv_path)
     out_json_path = Path(out_json_path)
 
-    # Read header to obtain the definitive list of columns
-    header_cols = pd.read_csv(csv_path, nrows=0).columns.tolist()
+    # One read of the leading lines serves header, detection and the t-code row
+    scan_rows = 5
+    head = _read_head(csv_path, max(scan_rows, tcode_row or 0) + 1)
+    header_cols = head[0] if head else []
     if date_col not in header_cols:
         raise ValueError(f"Expected date column '{date_col}' in CSV header; found {header_cols[:6]}...")
 
     # Determine which row contains t-codes
     if tcode_row is None:
         if autodetect_tcode_row:
-            tcode_row = _detect_tcode_row(csv_path, date_col=date_col) or 1
+            tcode_row = _scan_tcode_row(head, date_col) or 1
         else:
             tcode_row = 1  # conventional FRED-MD layout
 
     # Build tcode map from embedded row
-    raw_map = _read_embedded_tcode_map(csv_path, date_col=date_col, tcode_row=tcode_row)
+    if tcode_row >= len(head):
+        raise ValueError(f"{csv_path}: t-code row {tcode_row} is past the end of the file.")
+    raw_map = _tcode_map_from_row(header_cols, head[tcode_row], date_col)
 
     # Validate map against header columns (no need to read the data block)
     tcode_map, check = _validate_tcode_map_against_columns(
@@ -226,8 +230,7 @@ def extract_tcodes_to_json(
 
     # Write the pure mapping JSON
     out_json_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_json_path.open("w", encoding="utf-8") as f:
-        json.dump(tcode_map, f, indent=2, sort_keys=True)
+    dump_json(tcode_map, out_json_path, sort_keys=True)  # orjson when available
 
     # Optional sidecar metadata (keeps mapping JSON clean for downstream code)
     info = {
@@ -242,8 +245,7 @@ def extract_tcodes_to_json(
 
     if write_sidecar_metadata:
         meta_path = out_json_path.with_suffix(out_json_path.suffix + ".meta.json")
-        with meta_path.open("w", encoding="utf-8") as f:
-            json.dump(info, f, indent=2, sort_keys=True)
+        dump_json(info, meta_path, sort_keys=True)
         info["metadata_json_path"] = str(meta_path)
 
     return tcode_map, info
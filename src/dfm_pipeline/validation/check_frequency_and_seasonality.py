@@ -1,26 +1,59 @@
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import logging
-from typing import List, Tuple
-from time import sleep
+from typing import Dict, List, Optional, Tuple
+from time import gmtime, sleep, strftime
+
+from dfm_pipeline.utils.cached_config import dump_json, load_json
 
 HEADERS = {"User-Agent": "Mozilla/5.0"}
 FRED_SERIES_BASE_URL = "https://fred.stlouisfed.org/series/"
 
+# Concurrent page fetches; each worker still waits `delay` between its own requests
+MAX_WORKERS_DEFAULT = 8
+
+# On-disk memo of parsed pages: {label: {"freq", "seas", "etag", "fetched"}}; only successes are stored
+FRED_META_CACHE_PATH = "data/metadata/fred_page_cache.json"
+
+# Keep-alive session shared by the workers: one TCP/TLS handshake per pooled connection
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
+
 def read_series_labels(file_path: str) -> List[str]:
     with open(file_path, "r") as f:
         labels = [line.strip() for line in f if line.strip()]
     return labels
 
-def fetch_fred_metadata(label: str) -> Tuple[str, str]:
+def fetch_fred_metadata(
+    label: str,
+    session: Optional[requests.Session] = None,
+    cache: Optional[Dict[str, dict]] = None,
+) -> Tuple[str, str]:
+    """
+    Scrape (frequency, seasonal adjustment) from the series' FRED page.
+
+    With `cache`, a stored entry carrying an ETag is revalidated with If-None-Match: a 304
+    answers from the cache without downloading or parsing the page. Successful parses are
+    written back to `cache`; failures are never stored.
+    """
     url = FRED_SERIES_BASE_URL + label
+    cached = cache.get(label) if cache is not None else None
+    headers = HEADERS
+    if cached and cached.get("etag"):
+        headers = {**HEADERS, "If-None-Match": cached["etag"]}
     try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = (session or _SESSION).get(url, headers=headers, timeout=10)
         response.raise_for_status()
     except Exception as e:
         raise Exception(f"Could not fetch {label}: {e}")
 
+    if response.status_code == 304 and cached:
+        return cached["freq"], cached["seas"]
+
     soup = BeautifulSoup(response.text, "html.parser")
 
     # Find all metadata spans (this is a fallback for a more robust capture of values)
@@ -37,23 +70,62 @@ def fetch_fred_metadata(label: str) -> Tuple[str, str]:
     if not freq or not seas:
         raise Exception("Incomplete metadata")
 
+    if cache is not None:
+        cache[label] = {
+            "freq": freq,
+            "seas": seas,
+            "etag": response.headers.get("ETag"),
+            "fetched": strftime("%Y-%m-%dT%H:%M:%SZ", gmtime()),
+        }
     return freq, seas
 
-def check_series_metadata(labels: List[str], delay: float = 1.0) -> List[str]:
-    failed = []
-    results = []
 
-    for label in labels:
-        try:
-            freq, seas = fetch_fred_metadata(label)
-            results.append((label, freq, seas))
-            logging.info(f"{label}: Frequency = {freq}, Seasonality = {seas}")
-        except Exception as e:
-            logging.warning(f"Failed to fetch metadata for {label}: {e}")
-            failed.append(label)
+def _load_page_cache(path: str) -> Dict[str, dict]:
+    """Read the page cache; a missing or unreadable file starts an empty one."""
+    try:
+        return dict(load_json(path))  # own copy: load_json's result is shared
+    except (OSError, ValueError, TypeError):
+        return {}
+
+def _fetch_or_error(
+    label: str, delay: float, cache: Optional[Dict[str, dict]]
+) -> Tuple[str, Optional[Tuple[str, str]], Optional[Exception]]:
+    """Fetch one label, then pause `delay` seconds (per-worker politeness); errors are returned."""
+    try:
+        return label, fetch_fred_metadata(label, cache=cache), None
+    except Exception as e:
+        return label, None, e
+    finally:
         sleep(delay)
 
+
+def check_series_metadata(
+    labels: List[str],
+    delay: float = 1.0,
+    max_workers: int = MAX_WORKERS_DEFAULT,
+    cache_path: Optional[str] = FRED_META_CACHE_PATH,
+) -> List[str]:
+    failed = []
+    results = []
+    # cache_path=None disables the on-disk page cache
+    cache = _load_page_cache(cache_path) if cache_path else None
+
+    # Page fetches are I/O-bound: overlap them on a few threads. Reports keep input order.
+    n = len(labels)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, n or 1))) as ex:
+        for label, meta, err in ex.map(_fetch_or_error, labels, [delay] * n, [cache] * n):
+            if err is None:
+                freq, seas = meta
+                results.append((label, freq, seas))
+                logging.info(f"{label}: Frequency = {freq}, Seasonality = {seas}")
+            else:
+                logging.warning(f"Failed to fetch metadata for {label}: {err}")
+                failed.append(label)
+
     os.makedirs("data/metadata", exist_ok=True)
+    if cache is not None:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        dump_json(cache, cache_path, sort_keys=True)
     with open("data/metadata/series_metadata_report.txt", "w") as f:
         for label, freq, seas in results:
             f.write(f"{label}: Frequency = {freq}, Seasonality = {seas}\n")
@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, List
+import weakref
 
-import json
 import numpy as np
 import pandas as pd
 
+from dfm_pipeline.utils.cached_config import dump_json, dump_json_lines
+from dfm_pipeline.utils.jit import numba_kernel
+
 __all__ = [
     "BoundaryDates",
     "compute_missingness_by_series",
@@ -31,23 +36,171 @@ class BoundaryDates:
     notes: str = ""  # info about fallbacks if requested dates not found
 
 
-def _coerce_datetime_index(df: pd.DataFrame) -> pd.DataFrame:
+# id(index) -> (weak reference to that index, its DatetimeIndex or None if it already is
+# one, sort order or None if already sorted). Index objects are immutable, so an entry
+# cannot go stale; it is dropped with its index (hence no strong reference to it here).
+_COERCED_INDEX: Dict[int, Tuple[weakref.ref, Optional[pd.DatetimeIndex], Optional[np.ndarray]]] = {}
+
+
+def _coerced_index(idx: pd.Index) -> Tuple[pd.DatetimeIndex, Optional[np.ndarray]]:
     """
-    Ensure a DatetimeIndex sorted ascending. Raise a clear error otherwise.
+    Datetime conversion and ascending sort order (None if already sorted) of `idx`, worked
+    out once per index object: several diagnostics on the same frame parse/sort it once.
     """
-    if not isinstance(df.index, pd.DatetimeIndex):
+    key = id(idx)
+    hit = _COERCED_INDEX.get(key)
+    if hit is not None and hit[0]() is idx:
+        return (idx if hit[1] is None else hit[1]), hit[2]
+
+    if isinstance(idx, pd.DatetimeIndex):
+        dt_idx = idx
+    else:
         try:
-            df = df.copy()
-            df.index = pd.to_datetime(df.index, errors="raise")
+            dt_idx = pd.to_datetime(idx, errors="raise")
         except Exception as e:
             raise TypeError(
                 "DataFrame index must be a DatetimeIndex or convertible to datetime."
             ) from e
-    if not df.index.is_monotonic_increasing:
-        df = df.sort_index()
+    order = None if dt_idx.is_monotonic_increasing else dt_idx.argsort()  # same order as sort_index
+
+    _COERCED_INDEX[key] = (
+        weakref.ref(idx, lambda _ref, key=key: _COERCED_INDEX.pop(key, None)),
+        None if dt_idx is idx else dt_idx,
+        order,
+    )
+    return dt_idx, order
+
+
+def _coerce_datetime_index(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ensure a DatetimeIndex sorted ascending. Raise a clear error otherwise.
+    A frame that already has one is returned as is (no copy).
+    """
+    idx = df.index
+    if isinstance(idx, pd.DatetimeIndex) and idx.is_monotonic_increasing:
+        return df
+
+    dt_idx, order = _coerced_index(idx)
+    if dt_idx is not idx:
+        df = df.copy(deep=False)  # shallow: only the index differs
+        df.index = dt_idx
+    if order is not None:
+        df = df.take(order)
     return df
 
 
+def _na_mask(df: pd.DataFrame, rows: slice = slice(None)) -> np.ndarray:
+    """
+    Missing-value mask (T × C bool ndarray) of the rows selected by `rows`. Float panels go
+    straight through np.isnan on a view of the backing values (no boolean DataFrame, no
+    sliced frame); other dtypes fall back to pandas' isna.
+
+    The mask is column-major (Fortran order): every reduction here runs down axis 0, so
+    each column is then one contiguous stretch of memory.
+    """
+    if all(dt.kind == "f" for dt in df.dtypes):
+        values = df.to_numpy(dtype=np.float64, copy=False)[rows]
+        if not values.flags.f_contiguous:
+            values = np.asfortranarray(values)
+        return np.isnan(values)  # elementwise ufunc: keeps the F layout
+    return np.asfortranarray(df.iloc[rows].isna().to_numpy(dtype=bool))
+
+
+def _date_strings(idx: pd.DatetimeIndex, date_format: Optional[str] = None) -> np.ndarray:
+    """
+    Format every timestamp of `idx` in one vectorized call: `date_format` if given,
+    otherwise the same text as Timestamp.isoformat(). Returns an object array of str.
+    """
+    if date_format:
+        return np.asarray(idx.strftime(date_format), dtype=object)
+    if idx.tz is None and not (idx.asi8 % 1_000_000_000).any():
+        # Whole seconds, naive: isoformat() is exactly this pattern
+        return np.asarray(idx.strftime("%Y-%m-%dT%H:%M:%S"), dtype=object)
+    return np.array([ts.isoformat() for ts in idx], dtype=object)
+
+
+@numba_kernel
+def _run_stats_kernel(numba):
+    """Numba-compiled, column-parallel run scan (None without numba; see `numba_kernel`)."""
+    njit, prange = numba.njit, numba.prange
+
+    @njit(parallel=True, cache=True)
+    def kernel(mask):
+        T, C = mask.shape
+        n_runs = np.zeros(C, np.int64)
+        longest = np.zeros(C, np.int64)
+        first = np.full(C, -1, np.int64)
+        last = np.full(C, -1, np.int64)
+        for c in prange(C):
+            cur = 0
+            for t in range(T):
+                if mask[t, c]:
+                    if cur == 0:
+                        n_runs[c] += 1
+                        if first[c] == -1:
+                            first[c] = t
+                    cur += 1
+                    last[c] = t
+                    if cur > longest[c]:
+                        longest[c] = cur
+                else:
+                    cur = 0
+        return n_runs, longest, first, last
+
+    return kernel
+
+
+def _run_spans(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Every contiguous run of True in a (T × C) mask as (column, start row, end row + 1)
+    arrays, grouped by column and in time order within a column.
+    """
+    # Pad with a non-missing row on each side, then +1/-1 steps in the diff mark run
+    # starts/ends for all columns at once
+    n_rows, n_cols = mask.shape
+    padded = np.zeros((n_rows + 2, n_cols), dtype=np.int8, order="F")
+    padded[1:-1] = mask
+    steps = np.diff(padded, axis=0)
+    start_r, start_c = np.nonzero(steps.T == 1)[::-1]  # column-major: runs grouped by column
+    end_r = np.nonzero(steps.T == -1)[1]
+    return start_c, start_r, end_r
+
+
+def _run_stats(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-column run statistics of a (T × C) missing mask: (n_runs, longest_run, first, last)
+    as int64 arrays, where first/last are row positions of the first/last missing value
+    (-1 for a column with none). One compiled sweep when Numba is available.
+    """
+    kernel = _run_stats_kernel()
+    if kernel is not None:
+        return kernel(mask)
+    return _run_stats_numpy(mask)
+
+
+def _run_stats_numpy(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized NumPy version of `_run_stats`; fallback when numba is absent."""
+    n_rows, n_cols = mask.shape
+    start_c, start_r, end_r = _run_spans(mask)
+    n_runs = np.bincount(start_c, minlength=n_cols).astype(np.int64, copy=False)
+    longest = np.zeros(n_cols, dtype=np.int64)
+    np.maximum.at(longest, start_c, end_r - start_r)
+
+    has_missing = n_runs > 0
+    first = np.full(n_cols, -1, dtype=np.int64)
+    last = np.full(n_cols, -1, dtype=np.int64)
+    if n_rows:
+        first[has_missing] = mask.argmax(axis=0)[has_missing]
+        last[has_missing] = n_rows - 1 - mask[::-1].argmax(axis=0)[has_missing]
+    return n_runs, longest, first, last
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(s: str, fmt: Optional[str]) -> pd.Timestamp:
+    """Parse a boundary date string, memoized: batch diagnostics repeat the same few dates."""
+    return pd.Timestamp(datetime.strptime(s, fmt)) if fmt else pd.Timestamp(s)
+
+
 def _resolve_boundaries(
     idx: pd.DatetimeIndex,
     *,
@@ -62,9 +215,6 @@ def _resolve_boundaries(
     rows and record a note. If not provided, use positional rows.
     """
 
-    def _parse(s: str) -> pd.Timestamp:
-        return pd.to_datetime(s, format=date_format) if date_format else pd.to_datetime(s)
-
     # Defaults from index positions
     first = idx[0]
     last = idx[-1]
@@ -73,7 +223,7 @@ def _resolve_boundaries(
     # Optionally override with explicit dates (if present)
     notes = []
     if first_date:
-        cand = _parse(first_date)
+        cand = _parse_date(first_date, date_format)
         if cand in idx:
             first = cand
         else:
@@ -81,7 +231,7 @@ def _resolve_boundaries(
                 f"[info] requested first_date={cand.date()} not in index; using first row {first.date()}"
             )
     if second_date:
-        cand = _parse(second_date)
+        cand = _parse_date(second_date, date_format)
         if cand in idx:
             second = cand
         else:
@@ -89,7 +239,7 @@ def _resolve_boundaries(
                 f"[info] requested second_date={cand.date()} not in index; using second row {second.date()}"
             )
     if last_date:
-        cand = _parse(last_date)
+        cand = _parse_date(last_date, date_format)
         if cand in idx:
             last = cand
         else:
@@ -132,32 +282,25 @@ def compute_missingness_by_series(
         date_format=date_format,
     )
 
-    na = df.isna()
-
-    # Safe accessors for boundary rows (fallback to positional)
-    def _row_na(ts: pd.Timestamp, pos: int) -> pd.Series:
-        return na.loc[ts] if ts in idx else na.iloc[pos]
+    mask = _na_mask(df)
 
-    miss_first = _row_na(bounds.first, 0)
-    miss_second = _row_na(bounds.second, 1 if len(idx) > 1 else 0)
-    miss_last = _row_na(bounds.last, -1)
+    # Boundary rows by position: bounds always come from idx (sorted), so one
+    # searchsorted resolves all three without label lookups
+    first_i, second_i, last_i = idx.searchsorted([bounds.first, bounds.second, bounds.last])
+    miss_first = mask[first_i]
+    miss_second = mask[second_i]
+    miss_last = mask[last_i]
 
-    # Intermediate = strictly between bounds.second and bounds.last
-    if len(idx) >= 3:
-        mask_mid = (idx > bounds.second) & (idx < bounds.last)
-        na_mid = na.loc[mask_mid]
-        if na_mid.empty:
-            miss_mid_any = pd.Series(False, index=df.columns)
-            n_mid = pd.Series(0, index=df.columns, dtype="int64")
-        else:
-            miss_mid_any = na_mid.any(axis=0)
-            n_mid = na_mid.sum(axis=0).astype("int64")
-    else:
-        miss_mid_any = pd.Series(False, index=df.columns)
-        n_mid = pd.Series(0, index=df.columns, dtype="int64")
+    # Intermediate = strictly between bounds.second and bounds.last: a row slice of the
+    # sorted index (empty when last <= second)
+    mid_lo = idx.searchsorted(bounds.second, side="right")
+    mid_hi = idx.searchsorted(bounds.last, side="left")
+    na_mid = mask[mid_lo:mid_hi]
+    miss_mid_any = na_mid.any(axis=0)
+    n_mid = na_mid.sum(axis=0, dtype=np.int64)
 
     n_rows = len(df)
-    n_missing_total = na.sum(axis=0).astype("int64")
+    n_missing_total = mask.sum(axis=0, dtype=np.int64)
     pct_missing = (n_missing_total / float(n_rows)) * 100.0
 
     by_series = pd.DataFrame(
@@ -165,14 +308,15 @@ def compute_missingness_by_series(
             "n_rows": n_rows,
             "n_missing": n_missing_total,
             "pct_missing": pct_missing,
-            "miss_first": miss_first.astype(bool),
-            "miss_second": miss_second.astype(bool),
-            "miss_both_first_two": (miss_first & miss_second).astype(bool),
-            "miss_any_first_two": (miss_first | miss_second).astype(bool),
-            "miss_intermediate": miss_mid_any.astype(bool),
+            "miss_first": miss_first,
+            "miss_second": miss_second,
+            "miss_both_first_two": miss_first & miss_second,
+            "miss_any_first_two": miss_first | miss_second,
+            "miss_intermediate": miss_mid_any,
             "n_missing_intermediate": n_mid,
-            "miss_last": miss_last.astype(bool),
-        }
+            "miss_last": miss_last,
+        },
+        index=df.columns,
     ).sort_index()
 
     summary = {
@@ -214,15 +358,17 @@ def save_missingness_report(
 ) -> Tuple[Path, Path]:
     """
     Save the per-series table as CSV and the summary as JSON (pretty-printed).
+    The CSV text is the same as by_series.to_csv(float_format="%.10g").
     """
+    from dfm_pipeline.utils.io import fast_to_csv  # pulls in the optional Arrow reader
+
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     csv_path = out_dir / f"{stem}_by_series.csv"
     json_path = out_dir / f"{stem}_summary.json"
 
-    by_series.to_csv(csv_path, float_format="%.10g")
-    with json_path.open("w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    fast_to_csv(by_series, csv_path, date_fmt=None, float_fmt="%.10g", index_label=None)
+    dump_json(summary, json_path)
 
     return csv_path, json_path
 
@@ -250,72 +396,53 @@ def missing_positions_by_series(
     formatted using `date_format` (or ISO-8601 if None).
     """
     df = _coerce_datetime_index(df)
-    if start or end:
-        df = df.loc[start:end]
-
-    idx = df.index
-    na = df.isna()
-
-    n_rows = len(df)
-    n_missing = na.sum(axis=0).astype("int64")
-    pct_missing = (n_missing / float(n_rows)) * 100.0
+    # Window as a row slice (same label semantics as df.loc[start:end]) applied to the
+    # index and the mask only; the frame itself is never sliced
+    window = df.index.slice_indexer(start, end) if (start or end) else slice(None)
+    idx = df.index[window]
+    mask = _na_mask(df, window)
+
+    n_rows = len(idx)
+    n_missing = mask.sum(axis=0, dtype=np.int64)
+    with np.errstate(invalid="ignore"):  # empty window: NaN, silently (as pandas does)
+        pct_missing = (n_missing / float(n_rows)) * 100.0
+
+    n_runs_arr, longest_arr, first_pos, last_pos = _run_stats(mask)
+    has_missing = n_runs_arr > 0
+    # Position -1 (no missing value) becomes NaT; typed like the index, no per-column Series
+    first_missing = idx.take(first_pos, allow_fill=True, fill_value=pd.NaT)
+    last_missing = idx.take(last_pos, allow_fill=True, fill_value=pd.NaT)
+
+    # All row labels formatted once; each series then just picks its rows
+    labels = _date_strings(idx, date_format) if as_strings and has_missing.any() else None
 
     positions: Dict[str, List[pd.Timestamp | str]] = {}
-    first_missing: Dict[str, pd.Timestamp] = {}
-    last_missing: Dict[str, pd.Timestamp] = {}
-    n_runs: Dict[str, int] = {}
-    longest_run: Dict[str, int] = {}
-
-    def _runs_from_mask(mask: np.ndarray) -> List[tuple[int, int]]:
-        where = np.flatnonzero(mask)
-        if where.size == 0:
-            return []
-        splits = np.where(np.diff(where) > 1)[0] + 1
-        groups = np.split(where, splits)
-        return [(g[0], g[-1]) for g in groups]
-
-    for col in df.columns:
-        mask = na[col].to_numpy()
-        if mask.any():
-            where = np.flatnonzero(mask)
-            pos_idx = idx[where]
-
-            if as_strings:
-                if date_format:
-                    pos = [ts.strftime(date_format) for ts in pos_idx]
-                else:
-                    pos = [ts.isoformat() for ts in pos_idx]
-            else:
-                # Keep as Python datetime for JSON-serializable output via isoformat later if needed
-                pos = list(pos_idx.to_pydatetime())
-
-            if limit_positions is not None and len(pos) > limit_positions:
-                pos = pos[:limit_positions]
-
-            positions[col] = pos
-            first_missing[col] = idx[where[0]]
-            last_missing[col] = idx[where[-1]]
-
-            runs = _runs_from_mask(mask)
-            n_runs[col] = len(runs)
-            longest_run[col] = 0 if not runs else max(e - s + 1 for s, e in runs)
-        else:
+    for j, col in enumerate(df.columns):
+        if not has_missing[j]:
             positions[col] = []
-            first_missing[col] = pd.NaT
-            last_missing[col] = pd.NaT
-            n_runs[col] = 0
-            longest_run[col] = 0
+            continue
+        rows = np.flatnonzero(mask[:, j])
+        if labels is not None:
+            pos = labels[rows].tolist()
+        else:
+            # Keep as Python datetime for JSON-serializable output via isoformat later if needed
+            pos = list(idx[rows].to_pydatetime())
+
+        if limit_positions is not None and len(pos) > limit_positions:
+            pos = pos[:limit_positions]
+        positions[col] = pos
 
     summary_df = pd.DataFrame(
         {
             "n_rows": n_rows,
             "n_missing": n_missing,
-            "pct_missing": (n_missing / float(n_rows)) * 100.0,
-            "first_missing": pd.Series(first_missing),
-            "last_missing": pd.Series(last_missing),
-            "n_runs": pd.Series(n_runs, dtype="int64"),
-            "longest_run": pd.Series(longest_run, dtype="int64"),
-        }
+            "pct_missing": pct_missing,
+            "first_missing": first_missing,
+            "last_missing": last_missing,
+            "n_runs": n_runs_arr,
+            "longest_run": longest_arr,
+        },
+        index=df.columns,
     ).sort_index()
 
     return summary_df, positions
@@ -335,35 +462,41 @@ def missing_runs_by_series(
     Useful when you prefer a compact artifact over every missing date.
     """
     df = _coerce_datetime_index(df)
-    if start or end:
-        df = df.loc[start:end]
-
-    idx = df.index
-    na = df.isna()
-    rows: List[tuple[str, Any, Any, int]] = []
-
-    for col in df.columns:
-        mask = na[col].to_numpy()
-        where = np.flatnonzero(mask)
-        if where.size == 0:
-            continue
-        splits = np.where(np.diff(where) > 1)[0] + 1
-        groups = np.split(where, splits)
-        for g in groups:
-            s_iloc, e_iloc = int(g[0]), int(g[-1])
-            s, e = idx[s_iloc], idx[e_iloc]
-            if as_strings:
-                s = s.strftime(date_format) if date_format else s.isoformat()
-                e = e.strftime(date_format) if date_format else e.isoformat()
-            rows.append((col, s, e, e_iloc - s_iloc + 1))
-
-    return pd.DataFrame(rows, columns=["series", "start", "end", "length"])
+    window = df.index.slice_indexer(start, end) if (start or end) else slice(None)  # as above
+    idx = df.index[window]
+    mask = _na_mask(df, window)
+    col_pos, start_r, end_r = _run_spans(mask)
+    if col_pos.size == 0:
+        return pd.DataFrame([], columns=["series", "start", "end", "length"])
+
+    # One typed column each, gathered straight from the run positions
+    labels = _date_strings(idx, date_format) if as_strings else idx
+    return pd.DataFrame(
+        {
+            "series": df.columns.to_numpy()[col_pos],
+            "start": labels[start_r],
+            "end": labels[end_r - 1],
+            "length": end_r - start_r,
+        }
+    )
 
 
 # ====================== #
 #   Convenience savers   #
 # ====================== #
 
+def _isoformat_lists(lists: List[List[pd.Timestamp | str]]) -> List[List[str]]:
+    """
+    ISO-8601 strings for several lists of dates; strings pass through unchanged. When no
+    list holds strings, all dates are formatted in one call and split back per list.
+    """
+    if any(isinstance(ts, str) for v in lists for ts in v):
+        return [[ts if isinstance(ts, str) else pd.Timestamp(ts).isoformat() for ts in v] for v in lists]
+    flat = _date_strings(pd.DatetimeIndex([ts for v in lists for ts in v]))
+    ends = np.cumsum([len(v) for v in lists])
+    return [flat[e - len(v):e].tolist() for v, e in zip(lists, ends)]
+
+
 def save_positions_jsonl(
     positions: Dict[str, List[pd.Timestamp | str]],
     path: Path | str,
@@ -374,9 +507,10 @@ def save_positions_jsonl(
     """
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
-        for k, v in positions.items():
-            # Ensure strings for stability
-            vv = [ts if isinstance(ts, str) else pd.Timestamp(ts).isoformat() for ts in v]
-            f.write(json.dumps({"series": k, "missing_dates": vv}) + "\n")
+    # Ensure strings for stability (formatted in bulk); one buffer, one write
+    dates = _isoformat_lists(list(positions.values()))
+    dump_json_lines(
+        ({"series": k, "missing_dates": d} for k, d in zip(positions, dates)),
+        p,
+    )
     return p
@@ -1,19 +1,29 @@
 # src/dfm_pipeline/validation/stationarity.py
 from __future__ import annotations
 
-from typing import Optional, Dict, Any, Literal
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Literal, Tuple
+import os
 import warnings
 
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.stattools import adfuller, kpss
 
-# Optional tests via 'arch' (Phillips–Perron, DF-GLS, Zivot–Andrews)
-try:
-    from arch.unitroot import PhillipsPerron, DFGLS, ZivotAndrews  # type: ignore[import-not-found]
-    _HAVE_ARCH = True
-except Exception:
-    _HAVE_ARCH = False
+from dfm_pipeline.utils.parallel import limit_worker_threads
+
+# statsmodels (ADF/KPSS) and the optional 'arch' package (Phillips–Perron, DF-GLS,
+# Zivot–Andrews) are imported on first use: both are slow to load.
+
+
+@lru_cache(maxsize=None)
+def _arch_unitroot():
+    """Return the arch.unitroot module, or None if 'arch' is not installed."""
+    try:
+        from arch import unitroot  # type: ignore[import-not-found]
+    except Exception:
+        return None
+    return unitroot
 
 
 __all__ = [
@@ -31,6 +41,40 @@ def _clean_numeric_series(s: pd.Series) -> pd.Series:
     return pd.to_numeric(s, errors="coerce").dropna()
 
 
+@lru_cache(maxsize=256)
+def _adf_kpss_pvalues(
+    values_key: bytes, adf_autolag: Optional[str], kpss_reg: str, kpss_nlags: str | int
+) -> Tuple[float, float]:
+    """
+    ADF and KPSS p-values (NaN where a test fails) for one series given as float64 bytes.
+    Memoized, so re-validating the same panel (or identical columns) skips the lag search.
+    """
+    from statsmodels.tsa.stattools import adfuller, kpss
+
+    x = np.frombuffer(values_key, dtype=np.float64)
+    adf_p = kpss_p = np.nan
+
+    # ADF (H0: unit root)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            _stat, adf_p, *_ = adfuller(x, autolag=adf_autolag)
+        adf_p = float(adf_p)
+    except Exception:
+        pass
+
+    # KPSS (H0: stationarity)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            _stat, kpss_p, _lags, *_ = kpss(x, regression=kpss_reg, nlags=kpss_nlags)
+        kpss_p = float(kpss_p)
+    except Exception:
+        pass
+
+    return adf_p, kpss_p
+
+
 def _final_decision(adf_p: float, kpss_p: float, alpha: float) -> str:
     """
     Combine ADF (H0: unit root) and KPSS (H0: stationarity) into a single decision.
@@ -55,26 +99,26 @@ def _final_decision(adf_p: float, kpss_p: float, alpha: float) -> str:
 # Single-series interface
 # -------------------------
 
-def run_stationarity_tests_on_series(
-    s: pd.Series,
+def _tests_on_values(
+    values: np.ndarray,
+    index: Optional[pd.Index],
     *,
-    adf_autolag: Optional[str] = "AIC",
-    kpss_reg: Literal["c", "ct"] = "c",           # "c" (level) or "ct" (trend)
-    kpss_nlags: str | int = "auto",
-    run_pp: bool = False,
-    run_dfgls: bool = False,
-    run_za: bool = False,
-    alpha: float = 0.05,
+    adf_autolag: Optional[str],
+    kpss_reg: Literal["c", "ct"],
+    kpss_nlags: str | int,
+    run_pp: bool,
+    run_dfgls: bool,
+    run_za: bool,
+    alpha: float,
+    pp_trend: Literal["n", "c", "ct"] = "c",
+    dfgls_trend: Literal["c", "ct"] = "c",
+    za_trends: Tuple[str, ...] = ("c", "t", "ct"),
 ) -> pd.Series:
     """
-    Run ADF + KPSS (and optional PP, DF-GLS, ZA) on a single time series and
-    return a one-row summary (as a pandas Series).
-
-    Returns keys:
-      adf_pvalue, kpss_pvalue, pp_pvalue, dfgls_pvalue, za_pvalue, za_stat,
-      za_break_index, kpss_reg, n_non_na, decision
+    Core of `run_stationarity_tests_on_series` on an already clean series: `values` is a
+    contiguous float64 array without NaNs, handed as-is to every test. `index` holds the
+    matching timestamps (only used to date the Zivot–Andrews break; None leaves it NaN).
     """
-    x = _clean_numeric_series(s)
     out: Dict[str, Any] = {
         "adf_pvalue": np.nan,
         "kpss_pvalue": np.nan,
@@ -84,65 +128,54 @@ def run_stationarity_tests_on_series(
         "za_stat": np.nan,
         "za_break_index": np.nan,
         "kpss_reg": kpss_reg,
-        "n_non_na": int(x.shape[0]),
+        "n_non_na": int(values.shape[0]),
     }
 
-    if x.empty:
+    # Nothing to test: no observations, or a constant series (every test fails on it)
+    if values.size == 0 or values.min() == values.max():
         out["decision"] = "inconclusive"
         return pd.Series(out)
 
-    # ADF (H0: unit root)
-    try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            _stat, adf_p, *_ = adfuller(x, autolag=adf_autolag)
-        out["adf_pvalue"] = float(adf_p)
-    except Exception:
-        pass
+    unitroot = _arch_unitroot() if (run_pp or run_dfgls or run_za) else None
 
-    # KPSS (H0: stationarity)
-    try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            _stat, kpss_p, _lags, *_ = kpss(x, regression=kpss_reg, nlags=kpss_nlags)
-        out["kpss_pvalue"] = float(kpss_p)
-    except Exception:
-        pass
+    out["adf_pvalue"], out["kpss_pvalue"] = _adf_kpss_pvalues(
+        values.tobytes(), adf_autolag, kpss_reg, kpss_nlags
+    )
 
     # Optional: Phillips–Perron
-    if run_pp and _HAVE_ARCH:
+    if run_pp and unitroot is not None:
         try:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
-                out["pp_pvalue"] = float(PhillipsPerron(x).pvalue)
+                out["pp_pvalue"] = float(unitroot.PhillipsPerron(values, trend=pp_trend).pvalue)
         except Exception:
             pass
 
     # Optional: DF-GLS
-    if run_dfgls and _HAVE_ARCH:
+    if run_dfgls and unitroot is not None:
         try:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
-                out["dfgls_pvalue"] = float(DFGLS(x).pvalue)
+                out["dfgls_pvalue"] = float(unitroot.DFGLS(values, trend=dfgls_trend).pvalue)
         except Exception:
             pass
 
     # Optional: Zivot–Andrews (endogenous single break)
-    if run_za and _HAVE_ARCH:
+    if run_za and unitroot is not None:
         pvals: list[float] = []
         stats: list[float] = []
         breaks: list[Any] = []
-        for trend in ("c", "t", "ct"):  # type: Literal["c","t","ct"]
+        for trend in za_trends:  # each of "c", "t", "ct"
             try:
                 with warnings.catch_warnings():
                     warnings.simplefilter("ignore")
-                    za = ZivotAndrews(x, trend=trend)  # type: ignore[name-defined]
+                    za = unitroot.ZivotAndrews(values, trend=trend)
                 pvals.append(float(za.pvalue))  # type: ignore[attr-defined]
                 stats.append(float(za.stat))    # type: ignore[attr-defined]
                 # Some type checkers don't know 'breakpoint'; use getattr to be safe
                 bi = int(getattr(za, "breakpoint", -1))
-                if 0 <= bi < len(x.index):
-                    bts = x.index[bi]
+                if index is not None and 0 <= bi < len(index):
+                    bts = index[bi]
                 else:
                     bts = np.nan
                 breaks.append(bts)
@@ -160,10 +193,88 @@ def run_stationarity_tests_on_series(
     return pd.Series(out)
 
 
+def run_stationarity_tests_on_series(
+    s: pd.Series | np.ndarray,
+    *,
+    adf_autolag: Optional[str] = "AIC",
+    kpss_reg: Literal["c", "ct"] = "c",           # "c" (level) or "ct" (trend)
+    kpss_nlags: str | int = "auto",
+    run_pp: bool = False,
+    run_dfgls: bool = False,
+    run_za: bool = False,
+    alpha: float = 0.05,
+    pp_trend: Literal["n", "c", "ct"] = "c",
+    dfgls_trend: Literal["c", "ct"] = "c",
+    za_trends: Tuple[str, ...] = ("c", "t", "ct"),
+) -> pd.Series:
+    """
+    Run ADF + KPSS (and optional PP, DF-GLS, ZA) on a single time series and
+    return a one-row summary (as a pandas Series).
+
+    `s` may also be a numeric ndarray: it is taken as float64 with NaNs dropped, skipping
+    the pandas coercion; the Zivot–Andrews break date is then NaN (there is no index).
+
+    pp_trend / dfgls_trend set the deterministic terms of PP / DF-GLS; Zivot–Andrews runs
+    once per regression in za_trends and reports the most conservative (max p-value) one.
+
+    Returns keys:
+      adf_pvalue, kpss_pvalue, pp_pvalue, dfgls_pvalue, za_pvalue, za_stat,
+      za_break_index, kpss_reg, n_non_na, decision
+    """
+    if isinstance(s, np.ndarray):
+        values = np.ascontiguousarray(s, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        index = None
+    else:
+        x = _clean_numeric_series(s)
+        values = x.to_numpy(dtype=np.float64)
+        index = x.index
+
+    return _tests_on_values(
+        values,
+        index,
+        adf_autolag=adf_autolag,
+        kpss_reg=kpss_reg,
+        kpss_nlags=kpss_nlags,
+        run_pp=run_pp,
+        run_dfgls=run_dfgls,
+        run_za=run_za,
+        alpha=alpha,
+        pp_trend=pp_trend,
+        dfgls_trend=dfgls_trend,
+        za_trends=tuple(za_trends),
+    )
+
+
 # -------------------------
 # Panel (DataFrame) interface
 # -------------------------
 
+# Time index shared by every column of the panel; set once per worker process
+_PANEL_INDEX: Optional[pd.Index] = None
+
+
+def _init_panel_worker(index: pd.Index) -> None:
+    """Pool initializer: receive the panel's time index once and cap BLAS at one thread."""
+    global _PANEL_INDEX
+    limit_worker_threads()
+    _PANEL_INDEX = index
+
+
+def _test_column(values: np.ndarray, index: Optional[pd.Index], opts: Dict[str, Any]) -> pd.Series:
+    """Test one float64 panel column (NaNs included) against the panel's time index."""
+    keep = ~np.isnan(values)
+    # Only Zivot–Andrews needs the dates (to place the break)
+    dates = index[keep] if (opts["run_za"] and index is not None) else None
+    return _tests_on_values(values[keep], dates, **opts)
+
+
+def _panel_worker(item: Tuple[Any, np.ndarray, Dict[str, Any]]) -> pd.Series:
+    """Test one column shipped as (name, float64 values, options); the index comes from the initializer."""
+    _name, values, opts = item
+    return _test_column(values, _PANEL_INDEX, opts)
+
+
 def run_stationarity_tests_on_panel(
     df: pd.DataFrame,
     *,
@@ -174,28 +285,56 @@ def run_stationarity_tests_on_panel(
     run_dfgls: bool = False,
     run_za: bool = False,
     alpha: float = 0.05,
+    pp_trend: Literal["n", "c", "ct"] = "c",
+    dfgls_trend: Literal["c", "ct"] = "c",
+    za_trends: Tuple[str, ...] = ("c", "t", "ct"),
+    n_jobs: Optional[int] = 1,
 ) -> pd.DataFrame:
     """
     Apply `run_stationarity_tests_on_series` to each column of a panel.
 
+    Columns are independent and CPU-bound, so with n_jobs > 1 (None = all cores) they are
+    spread over a process pool; each column is shipped as a plain float64 array. Keep the
+    default n_jobs=1 when the caller already runs one panel per process.
+
     Returns a DataFrame indexed by series names with the same columns as the
     single-series output plus the final 'decision'.
     """
-    results: Dict[str, pd.Series] = {}
-
-    for col in df.columns:
-        s = df[col]
-        res = run_stationarity_tests_on_series(
-            s,
-            adf_autolag=adf_autolag,
-            kpss_reg=kpss_reg,
-            kpss_nlags=kpss_nlags,
-            run_pp=run_pp,
-            run_dfgls=run_dfgls,
-            run_za=run_za,
-            alpha=alpha,
+    opts = dict(
+        adf_autolag=adf_autolag,
+        kpss_reg=kpss_reg,
+        kpss_nlags=kpss_nlags,
+        run_pp=run_pp,
+        run_dfgls=run_dfgls,
+        run_za=run_za,
+        alpha=alpha,
+        pp_trend=pp_trend,
+        dfgls_trend=dfgls_trend,
+        za_trends=tuple(za_trends),
+    )
+    cols = list(df.columns)
+    workers = min(n_jobs or os.cpu_count() or 1, len(cols))
+
+    # One float64 (T × N) matrix up front: a view for plain NumPy numeric panels, otherwise
+    # built from the coerced columns. Every path below works on its bare columns.
+    if all(isinstance(dt, np.dtype) and dt.kind in "biuf" for dt in df.dtypes):
+        values = df.to_numpy(dtype=np.float64, copy=False)
+    else:
+        values = np.column_stack(
+            [pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64) for col in cols]
         )
-        results[col] = res
+
+    if workers <= 1:
+        results: Dict[str, pd.Series] = {
+            col: _test_column(values[:, j], df.index, opts) for j, col in enumerate(cols)
+        }
+    else:
+        items = [(col, values[:, j], opts) for j, col in enumerate(cols)]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_panel_worker, initargs=(df.index,)
+        ) as ex:
+            chunksize = max(1, len(cols) // (4 * workers))
+            results = dict(zip(cols, ex.map(_panel_worker, items, chunksize=chunksize)))
 
     out = pd.DataFrame(results).T
     out.index.name = "series"
@@ -1,12 +1,46 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple, List
+from numbers import Integral, Real
+from typing import Any, Dict, Tuple, List
+import math
+import re
+
 import numpy as np
 
 
 # Single source of truth for allowed Stock–Watson/FRED-MD transform codes
 ALLOWED_TCODES: set[int] = {1, 2, 3, 4, 5, 6, 7}
 
+# Same set as a bitmask (bit c set <=> code c allowed; 0xFE): one shift-and-test per check
+TCODE_MASK: int = sum(1 << c for c in ALLOWED_TCODES)
+
+
+def is_allowed_tcode(code: int) -> bool:
+    """True if the integer `code` is in ALLOWED_TCODES (branch-free bitmask test)."""
+    return 0 <= code < TCODE_MASK.bit_length() and (TCODE_MASK >> code) & 1 == 1
+
+
+def allowed_tcode_mask(codes: np.ndarray) -> np.ndarray:
+    """Vectorized is_allowed_tcode: boolean array, True where the integer code is allowed."""
+    codes = np.asarray(codes, dtype=np.int64)
+    in_range = (codes >= 0) & (codes < TCODE_MASK.bit_length())
+    return in_range & (np.right_shift(TCODE_MASK, np.clip(codes, 0, 63)) & 1).astype(bool)
+
+
+# What int() accepts from a string of digits: optional sign, surrounding whitespace
+_INT_TEXT = re.compile(r"\s*[+-]?\d+\s*", re.ASCII)
+
+
+def _coerce_tcode(v: Any) -> int:
+    """int(v) for ints, finite floats and integer strings; -1 (never allowed) for anything else."""
+    if isinstance(v, Integral):
+        return int(v)
+    if isinstance(v, Real):
+        return int(v) if math.isfinite(v) else -1
+    if isinstance(v, str) and _INT_TEXT.fullmatch(v):
+        return int(v)
+    return -1
+
 
 def validate_tcode_map_against_columns(
     df_columns: List[str],
@@ -42,18 +76,15 @@ def validate_tcode_map_against_columns(
         If require_all=True and some columns are missing in the mapping.
     """
     cols = [c for c in df_columns if c != date_col]
+    col_set = set(cols)  # O(1) membership instead of a list scan per key
 
-    cleaned: Dict[str, int] = {}
-    for k, v in tcode_map.items():
-        try:
-            iv = int(v)  # accept numeric strings too
-        except (TypeError, ValueError):
-            iv = np.nan
-        if k in cols and iv in ALLOWED_TCODES:
-            cleaned[k] = int(iv)
+    # Codes coerced without exceptions (numeric strings accepted), unknown codes dropped
+    cleaned: Dict[str, int] = {
+        k: iv for k, v in tcode_map.items() if k in col_set and is_allowed_tcode(iv := _coerce_tcode(v))
+    }
 
     missing = [c for c in cols if c not in cleaned]
-    extra = [k for k in tcode_map if k not in cols and k != date_col]
+    extra = [k for k in tcode_map if k not in col_set and k != date_col]
 
     if require_all and missing:
         raise KeyError(f"No tcode for columns: {missing}")